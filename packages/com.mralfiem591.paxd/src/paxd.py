@@ -20,45 +20,65 @@ PIP_PACKAGES = []
 
 # Store the current file path for use in cleanup function
 CURRENT_FILE_PATH = os.path.abspath(__file__)
+# Paths used all over PaxD, worked out once at startup
+PAXD_DIR = os.path.dirname(__file__)  # Where paxd.py lives (repository, .VERSION, bin, extensions, ...)
+BIN_DIR = os.path.join(os.path.dirname(CURRENT_FILE_PATH), "bin")  # Package launcher .bat files (on PATH)
+LOCAL_APP_DATA_PAXD = os.path.join(os.environ.get("LOCALAPPDATA", ""), "PaxD")  # %LOCALAPPDATA%/PaxD, where packages are installed
+PAXD_PACKAGE_DIR = os.path.join(LOCAL_APP_DATA_PAXD, "com.mralfiem591.paxd")  # PaxD's own package folder
+PAXD_SDK_MAIN = os.path.join(LOCAL_APP_DATA_PAXD, "com.mralfiem591.paxd-sdk", "main.py")  # The PaxD SDK, loaded as paxd_sdk
+RUN_PKG_PATH = os.path.join(PAXD_PACKAGE_DIR, "run_pkg.py")  # Launcher every package's bin/*.bat goes through
+
+# The launcher written to bin/paxd.bat, and the exact bytes it ends up as on disk (text mode writes os.linesep)
+PAXD_BAT_CONTENT = f'@echo off\n"{sys.executable}" "{CURRENT_FILE_PATH}" %*\n'
+PAXD_BAT_BYTES = PAXD_BAT_CONTENT.replace("\n", os.linesep).encode()
 
 SDK_BACKUP = False
 
 def cleanup():
-    # Check if the bat file exists and contains run_pkg.py (which is a bug)
-    bat_file_path = os.path.join(os.path.expandvars(r"%LOCALAPPDATA%"), "PaxD", "com.mralfiem591.paxd", "bin", "paxd.bat")
-    needs_rewrite = False
-    if os.path.exists(bat_file_path):
-        try:
-            with open(bat_file_path, 'r') as f:
-                content = f.read()
-                if "run_pkg.py" in content:
-                    needs_rewrite = True
-        except (IOError, OSError):
-            needs_rewrite = True
-    else:
+    bat_file_path = os.path.join(PAXD_PACKAGE_DIR, "bin", "paxd.bat")
+    # Fast path: the bat file is already exactly what we'd write - a size check rules most other files out without reading them
+    try:
+        if os.path.getsize(bat_file_path) == len(PAXD_BAT_BYTES) and PathLib(bat_file_path).read_bytes() == PAXD_BAT_BYTES:
+            return
+    except OSError:
+        pass
+    # Check if the bat file exists and contains run_pkg.py (which is a bug) - a missing file fails the open, so no separate exists check
+    try:
+        with open(bat_file_path, 'r') as f:
+            needs_rewrite = "run_pkg.py" in f.read()
+    except OSError:
         needs_rewrite = True
     
     if needs_rewrite:
         # Ensure the bin directory exists
         os.makedirs(os.path.dirname(bat_file_path), exist_ok=True)
         with open(bat_file_path, 'w') as f:
-            f.write("@echo off\n")
-            f.write(f'"{sys.executable}" "{CURRENT_FILE_PATH}" %*\n')
+            f.write(PAXD_BAT_CONTENT)
 
 atexit.register(cleanup)
 
 import subprocess
 import requests # type: ignore (requests is in paxd file dependencies)
+from requests.adapters import HTTPAdapter # type: ignore (requests is in paxd file dependencies)
+from urllib3.util.retry import Retry # type: ignore (urllib3 comes with requests)
 import json
+import datetime
+import time
+import stat
 from pathlib import Path as PathLib
-import hashlib
-import zipfile
 import shutil
+import tempfile
 import argparse # type: ignore (argparse is in paxd file dependencies)
 from colorama import init, Fore, Style  # type: ignore (colorama is in paxd file dependencies)
-import yaml # type: ignore (yaml is in paxd file dependencies)
 import re
 
+# Use orjson for parsing manifests if it's available (several times faster), falling back to the standard json module
+try:
+    import orjson  # type: ignore
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 try:
     import ctypes
     import winreg
@@ -86,119 +106,101 @@ class PackageNotFoundError(Exception):
     pass
 
 def find_sdk():
-    import sys, importlib.abc, importlib.util
+    import sys, importlib.abc, importlib.machinery, importlib.util
 
-    if not os.path.exists(os.path.join(os.path.expandvars('%LOCALAPPDATA%'), 'PaxD', 'com.mralfiem591.paxd-sdk', 'main.py')):
+    if not os.path.exists(PAXD_SDK_MAIN):
         print("PaxD SDK is not installed. Please install PaxD SDK to run this package, via 'paxd install paxd-sdk'.")
         print("ALERT: PaxD SDK is required, but cannot be installed normally due to PaxD not being able to run. A forced installation will begin.")
         global SDK_BACKUP
         SDK_BACKUP = True
 
-    SDK_PATH = os.path.join(os.path.expandvars('%LOCALAPPDATA%'), 'PaxD', 'com.mralfiem591.paxd-sdk', 'main.py')
-
-    class PaxDSDKLoader(importlib.abc.Loader):
-        def create_module(self, spec):
-            return None  # Use default module creation semantics
-
-        def exec_module(self, module):
-            with open(SDK_PATH, 'r') as f:
-                code = f.read()
-            exec(compile(code, SDK_PATH, 'exec'), module.__dict__)
-        
     class PaxDSDKFinder(importlib.abc.MetaPathFinder):
         def find_spec(self, fullname, path, target=None):
             if fullname == 'paxd_sdk':
-                return importlib.util.spec_from_loader(fullname, PaxDSDKLoader())
+                # SourceFileLoader caches the compiled SDK in __pycache__, so it's only recompiled when main.py changes
+                return importlib.util.spec_from_file_location(fullname, PAXD_SDK_MAIN, loader=importlib.machinery.SourceFileLoader(fullname, PAXD_SDK_MAIN))
             return None
 
     sys.meta_path.insert(0, PaxDSDKFinder())
     
-try:
-    find_sdk()
-    import paxd_sdk  # type: ignore
-    
-    messages = paxd_sdk.Messaging.GetMessages("com.mralfiem591.paxd")
-    
-    if messages:
-        print("New messages available!")
-        for message in messages:
-            print(f"{Fore.CYAN}--- MESSAGE START ---{Style.RESET_ALL}")
-            print(f"FROM: {message['from']}")
-            print(f"SENT: {message['timestamp']}")
-            print("CONTENT:")
-            for key, value in message['message'].items():
-                print(f" - {key.title()}: {value}")
-            print(f"{Fore.CYAN}--- MESSAGE END ---{Style.RESET_ALL}\n")
-            
-    paxd_sdk.Messaging.ClearMessages("com.mralfiem591.paxd")
-except Exception:
-    print("Warning: Could not load PaxD SDK. Some functionality may be limited.")
-    pass
+SDK_MESSAGES_CHECKED = False
+
+def _check_sdk_messages():
+    """Load the PaxD SDK and show any messages waiting for PaxD (at most once per run)."""
+    global SDK_MESSAGES_CHECKED, paxd_sdk
+    if SDK_MESSAGES_CHECKED:
+        return
+    SDK_MESSAGES_CHECKED = True
+    try:
+        find_sdk()
+        import paxd_sdk  # type: ignore
+        
+        messages = paxd_sdk.Messaging.GetMessages("com.mralfiem591.paxd")
+        
+        if messages:
+            print("New messages available!")
+            for message in messages:
+                print(f"{Fore.CYAN}--- MESSAGE START ---{Style.RESET_ALL}")
+                print(f"FROM: {message['from']}")
+                print(f"SENT: {message['timestamp']}")
+                print("CONTENT:")
+                for key, value in message['message'].items():
+                    print(f" - {key.title()}: {value}")
+                print(f"{Fore.CYAN}--- MESSAGE END ---{Style.RESET_ALL}\n")
+                
+        paxd_sdk.Messaging.ClearMessages("com.mralfiem591.paxd")
+    except Exception:
+        print("Warning: Could not load PaxD SDK. Some functionality may be limited.")
+        pass
 
 lexicographic_max_default = 10000
 
 def convert_to_lexicographic_position(n, max_range=lexicographic_max_default):
     """Convert a sequential number to its lexicographic position."""
-    # Generate numbers as strings and sort them lexicographically
-    string_numbers = [str(i) for i in range(max_range)]
-    sorted_strings = sorted(string_numbers)
-    
-    # Return the number at position n
-    if n < len(sorted_strings):
-        return int(sorted_strings[n])
-    else:
+    if n >= max_range:
         # If n exceeds our range, raise a LexicographicConversionError
         raise LexicographicConversionError(f"Input {n} exceeds maximum range {max_range}")
+    # "0" always sorts first; after it come 1..max_range-1 in lexicographic order
+    if n == 0:
+        return 0
+
+    # Walk the digit tree instead of building and sorting every number as a string:
+    # skip whole prefixes (e.g. everything starting with "1") while n is past them, otherwise descend into them
+    largest = max_range - 1
+    current = 1
+    n -= 1
+    while n > 0:
+        # Count the numbers in 1..largest that start with the digits of current
+        count, first, last = 0, current, current
+        while first <= largest:
+            count += min(largest, last) - first + 1
+            first *= 10
+            last = last * 10 + 9
+        if count <= n:
+            current += 1
+            n -= count
+        else:
+            current *= 10
+            n -= 1
+    return current
     
-LOGS_VERBOSE = {}
+LOGS_VERBOSE = []  # (sequence number, time.time() when logged, message) for every verbose log line, in logging order
+
+# Matches a JSON string, a // line comment or a /* block comment */ - strings are matched first so comment markers inside them are left alone
+JSONC_TOKEN_PATTERN = re.compile(r'"(?:\\.|[^"\\])*"|//[^\n]*|/\*[\s\S]*?\*/')
+
+def _keep_jsonc_strings(match):
+    token = match.group(0)
+    return token if token.startswith('"') else ''
 
 def parse_jsonc(jsonc_text: str) -> dict:
     """Parse JSONC (JSON with comments) by removing comments."""
-    
-    # Remove single-line comments (// ...)
-    lines = jsonc_text.split('\n')
-    cleaned_lines = []
-    
-    for line in lines:
-        # Find // that's not inside a string
-        in_string = False
-        escaped = False
-        comment_pos = None
-        
-        for i, char in enumerate(line):
-            if escaped:
-                escaped = False
-                continue
-                
-            if char == '\\' and in_string:
-                escaped = True
-                continue
-                
-            if char == '"' and not escaped:
-                in_string = not in_string
-                continue
-                
-            if not in_string and char == '/' and i + 1 < len(line) and line[i + 1] == '/':
-                comment_pos = i
-                break
-        
-        if comment_pos is not None:
-            cleaned_lines.append(line[:comment_pos].rstrip())
-        else:
-            cleaned_lines.append(line)
-    
-    cleaned_json = '\n'.join(cleaned_lines)
-    return json.loads(cleaned_json)
+    return json_loads(JSONC_TOKEN_PATTERN.sub(_keep_jsonc_strings, jsonc_text))
 
 def strip_jsonc_comments(jsonc_content: str) -> str:
     """Remove comments from JSONC content to make it valid JSON."""
-    # Remove single-line comments (// ...)
-    jsonc_content = re.sub(r'//.*?$', '', jsonc_content, flags=re.MULTILINE)
-    
-    # Remove multi-line comments (/* ... */)
-    jsonc_content = re.sub(r'/\*.*?\*/', '', jsonc_content, flags=re.DOTALL)
-    
-    return jsonc_content
+    # Remove single-line (// ...) and multi-line (/* ... */) comments in one pass, leaving strings untouched
+    return JSONC_TOKEN_PATTERN.sub(_keep_jsonc_strings, jsonc_content)
 
 def parse_json_manifest(json_content: str) -> dict:
     """Parse JSON/JSONC manifest content."""
@@ -206,7 +208,7 @@ def parse_json_manifest(json_content: str) -> dict:
     clean_json = strip_jsonc_comments(json_content)
     
     try:
-        return json.loads(clean_json)
+        return json_loads(clean_json)
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON format: {e}")
 
@@ -294,13 +296,70 @@ def compile_paxd_manifest(yaml_data: dict) -> dict:
 
 def permission_handler(func, path, exc_info):
     """Error handler for shutil.rmtree to handle permission errors."""
-    import stat
     if not os.access(path, os.W_OK):
         os.chmod(path, stat.S_IWUSR)
         func(path)
     else:
         raise
 
+def _atomic_write(path: str, data, mode: str = 'w'):
+    """Write data to a file atomically, so a crash mid-write never leaves a truncated file behind."""
+    # Unique temp name in the same directory, so concurrent writers never share a temp file and os.replace stays on one volume
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _stripped_sha256(path: str, block_size: int = 1 << 20) -> str:
+    """SHA-256 of a file with leading/trailing whitespace ignored (same result as hasher.py), streamed in blocks."""
+    import hashlib  # Only needed when verifying checksums
+    whitespace = b" \t\n\r\x0b\x0c"  # What bytes.strip() removes
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+
+        # Find where the trailing whitespace starts by walking backwards block by block
+        end = size
+        while end > 0:
+            start = max(0, end - block_size)
+            f.seek(start)
+            block = f.read(end - start).rstrip(whitespace)
+            if block:
+                end = start + len(block)
+                break
+            end = start
+
+        # Skip leading whitespace
+        f.seek(0)
+        begin = 0
+        while begin < end:
+            block = f.read(min(block_size, end - begin))
+            stripped = block.lstrip(whitespace)
+            begin += len(block) - len(stripped)
+            if stripped:
+                break
+
+        # Hash only the bytes between the two
+        f.seek(begin)
+        if end == size and hasattr(hashlib, "file_digest"):
+            # No trailing whitespace, so everything from here to EOF is hashed - file_digest does that in C (Python 3.11+)
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        remaining = end - begin
+        while remaining > 0:
+            block = f.read(min(block_size, remaining))
+            if not block:
+                break
+            digest.update(block)
+            remaining -= len(block)
+    return digest.hexdigest()
+
 def is_admin() -> bool:
     """Check if the script is running with administrator privileges."""
     if not WINDOWS_AVAILABLE or ctypes is None:
@@ -319,57 +378,55 @@ def add_to_path(folder_path: str) -> bool:
         
     folder_path = str(PathLib(folder_path).resolve())
     
+    environment_key = r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment"
     try:
-        # Open the Environment registry key
-        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,  # type: ignore
-                           r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment",
-                           0, winreg.KEY_ALL_ACCESS) as key:  # type: ignore
-            
-            # Get current PATH value
+        # Read the current PATH value with read-only access first - most of the time there's nothing to change
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, environment_key, 0, winreg.KEY_READ) as key:  # type: ignore
             try:
                 current_path, _ = winreg.QueryValueEx(key, "PATH")  # type: ignore
             except FileNotFoundError:
                 current_path = ""
+        
+        # Check if folder is already in PATH (ignoring case, trailing slashes and the like, as Windows does)
+        path_entries = {os.path.normcase(os.path.normpath(p.strip())) for p in current_path.split(os.pathsep) if p.strip()}
+        if os.path.normcase(os.path.normpath(folder_path)) in path_entries:
+            print(f"{folder_path} is already in PATH")
+            return True
+        
+        # Add folder to PATH - only now is write access needed
+        new_path = current_path + os.pathsep + folder_path if current_path else folder_path
+        try:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, environment_key, 0, winreg.KEY_SET_VALUE) as key:  # type: ignore
+                winreg.SetValueEx(key, "PATH", 0, winreg.REG_EXPAND_SZ, new_path)  # type: ignore
+        except Exception as reg_error:
+            print(f"Failed to modify registry: {reg_error}")
+            return False
+        print(f"Added {folder_path} to system PATH")
+        print("Note the shell will need restarted before this takes effect!")
+        
+        # Try to notify system of environment change, but don't let it hang
+        try:
+            # Use SendMessageTimeout with a 5-second timeout to prevent hanging
+            import threading
             
-            # Check if folder is already in PATH
-            path_entries = [p.strip() for p in current_path.split(os.pathsep)]
-            if folder_path not in path_entries:
-                # Add folder to PATH
-                new_path = current_path + os.pathsep + folder_path
+            def notify_environment_change():
                 try:
-                    winreg.SetValueEx(key, "PATH", 0, winreg.REG_EXPAND_SZ, new_path)  # type: ignore
-                    print(f"Added {folder_path} to system PATH")
-                    print("Note the shell will need restarted before this takes effect!")
-                    
-                    # Try to notify system of environment change, but don't let it hang
-                    try:
-                        # Use SendMessageTimeout with a 5-second timeout to prevent hanging
-                        import threading
-                        
-                        def notify_environment_change():
-                            try:
-                                # HWND_BROADCAST = 0xFFFF, WM_SETTINGCHANGE = 0x001A
-                                ctypes.windll.user32.SendMessageTimeoutW( # type: ignore
-                                    0xFFFF, 0x001A, 0, "Environment", 0x0002, 5000, None
-                                )
-                            except:
-                                pass  # Ignore any errors during notification
-                        
-                        # Run notification in separate thread with timeout, due to an existing bug
-                        notify_thread = threading.Thread(target=notify_environment_change, daemon=True)
-                        notify_thread.start()
-                        notify_thread.join(timeout=6.0)  # Wait max 6 seconds
-                        
-                    except Exception:
-                        pass  # Ignore notification errors - the PATH change was successful
-                    
-                    return True
-                except Exception as reg_error:
-                    print(f"Failed to modify registry: {reg_error}")
-                    return False
-            else:
-                print(f"{folder_path} is already in PATH")
-                return True
+                    # HWND_BROADCAST = 0xFFFF, WM_SETTINGCHANGE = 0x001A
+                    ctypes.windll.user32.SendMessageTimeoutW( # type: ignore
+                        0xFFFF, 0x001A, 0, "Environment", 0x0002, 5000, None
+                    )
+                except:
+                    pass  # Ignore any errors during notification
+            
+            # Run notification in separate thread with timeout, due to an existing bug
+            notify_thread = threading.Thread(target=notify_environment_change, daemon=True)
+            notify_thread.start()
+            notify_thread.join(timeout=6.0)  # Wait max 6 seconds
+            
+        except Exception:
+            pass  # Ignore notification errors - the PATH change was successful
+        
+        return True
                 
     except Exception as e:
         print(f"Error modifying PATH: {e}")
@@ -450,6 +507,7 @@ class ExtensionManager:
             # Extract zip to extension directory
             os.makedirs(extension_dir, exist_ok=True)
             
+            import zipfile
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
                 zip_ref.extractall(extension_dir)
             
@@ -588,6 +646,7 @@ class ExtensionManager:
             # Extract new version
             os.makedirs(extension_dir, exist_ok=True)
             
+            import zipfile
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
                 zip_ref.extractall(extension_dir)
             
@@ -700,7 +759,7 @@ class ExtensionManager:
                 'print': print,
                 'os': os,
                 'sys': sys,
-                'datetime': __import__('datetime'),
+                'datetime': datetime,
                 'json': __import__('json'),
                 # Add more safe modules as needed
             }
@@ -743,14 +802,65 @@ class ExtensionManager:
             print(f"Failed to load extension {extension_name}: {e}")
 
 
+def _fmt_lines(*lines: str) -> str:
+    """Join output lines into one template, resetting colour at the end of each (colorama only autoresets per write)."""
+    return "\n".join(line + Style.RESET_ALL for line in lines)
+
+# Output templates, built once at import instead of re-assembling the colour codes on every print
+_SEP_BLUE = Fore.BLUE + '=' * 60 + Style.RESET_ALL
+_REPO_INFO_FMT = _fmt_lines(
+    f"{Fore.CYAN}Repository Information:",
+    f"{Fore.YELLOW}Name:{Style.RESET_ALL} {{name}}",
+    f"{Fore.MAGENTA}Author:{Style.RESET_ALL} {{author}}",
+    f"{Fore.WHITE}Description:{Style.RESET_ALL} {{description}}",
+    f"{Fore.GREEN}Website:{Style.RESET_ALL} {{site}}",
+    f"{Fore.BLUE}URL:{Style.RESET_ALL} {{url}}",
+)
+_REPO_CREDIT_FMT = _fmt_lines(f"{Fore.GREEN}- {{}}: {{}}")
+_CREDIT_TEXT = _fmt_lines(
+    f"{Fore.CYAN}PaxD (Package xpress Delivery) - Package Manager for Developers",
+    f"{Fore.WHITE}Developed by mralfiem591",
+    f"{Fore.LIGHTBLUE_EX}Powered by Python",
+    f"{Fore.LIGHTMAGENTA_EX}Inspired by package managers like pip, npm, winget, and apt-get",
+    f"{Fore.YELLOW}View repository credits and info via the '{Fore.LIGHTYELLOW_EX}paxd repo-info{Fore.YELLOW}' command",
+)
+_SEARCH_FOUND_FMT = _fmt_lines(f"{Fore.GREEN}Found {Fore.WHITE}{{}}{Fore.GREEN} package(s):", "")
+_SEARCH_STATUS_INSTALLED = f"{Fore.GREEN}[INSTALLED]{Style.RESET_ALL}"
+_SEARCH_STATUS_NOT_INSTALLED = f"{Fore.RED}[NOT INSTALLED]{Style.RESET_ALL}"
+_SEARCH_ROW_HEAD_FMT = _fmt_lines(
+    f"{{status}} {Fore.CYAN}{{display_name}}",
+    f"  {Fore.WHITE}Package:{Style.RESET_ALL} {{package_name}}",
+)
+_SEARCH_ALIAS_FMT = _fmt_lines(f"  {Fore.YELLOW}Alias:{Style.RESET_ALL} {{}}")
+_SEARCH_OTHER_ALIASES_FMT = _fmt_lines(f"  {Fore.YELLOW}Other aliases:{Style.RESET_ALL} {{}}")
+_SEARCH_ROW_TAIL_FMT = _fmt_lines(
+    f"  {Fore.MAGENTA}Author:{Style.RESET_ALL} {{author}}",
+    f"  {Fore.BLUE}Version:{Style.RESET_ALL} {{version}}",
+    f"  {Fore.WHITE}Description:{Style.RESET_ALL} {{description}}",
+    f"  {Fore.GREEN}Matches:{Style.RESET_ALL} {{matches}}",
+    "",
+)
+_SEARCH_INSTALL_HINT = _fmt_lines(f"{Fore.CYAN}To install a package, use: {Fore.GREEN}paxd install <package_name_or_alias>")
+
+
 class PaxD:
+    # Shared by every PaxD instance, so the repository file is read and its URL resolved once per process
+    _repo_url_cache = None  # contents of the repository file
+    _resolved_repo_urls = {}  # raw repository URL -> resolved URL
+
+    # Every instance attribute PaxD sets - no per-instance __dict__ (class-level caches above are set through PaxD.<name>)
+    __slots__ = (
+        "paxd_version_phrase", "repository_file", "paxd_version", "verbose", "paxd_auth_token", "headers", "local_app_data",
+        "_metadata_etags", "_metadata_unchanged_results", "_repo_listings", "_installed_set_cache", "_depgraph",
+        "_resolutions", "_session", "trigger_system", "extension_manager", "_timing_start",
+    )
+
     def __init__(self, verbose=False):
         self.paxd_version_phrase = "The MetaPackage Update"
-        self.repository_file = os.path.join(os.path.dirname(__file__), "repository")
-        if os.path.exists(os.path.join(os.path.dirname(__file__), ".VERSION")):
-            with open(os.path.join(os.path.dirname(__file__), ".VERSION"), 'r') as vf:
-                self.paxd_version = vf.read().strip()
-        else:
+        self.repository_file = os.path.join(PAXD_DIR, "repository")
+        try:
+            self.paxd_version = PathLib(PAXD_DIR, ".VERSION").read_text().strip()
+        except FileNotFoundError:
             self.paxd_version = "0.0.0"
             self.paxd_version_phrase += " (.VERSION missing)"
         __version__ = self.paxd_version
@@ -762,12 +872,27 @@ class PaxD:
         else:
             self.headers = {"User-Agent": f"PaxdClient/{self.paxd_version}"}
         self.verbose = verbose
-        
+        self.local_app_data = LOCAL_APP_DATA_PAXD
+        self._metadata_etags = {}  # package_name -> (metadata url, ETag) of the last metadata fetch
+        self._metadata_unchanged_results = {}  # package_name -> result of the last _metadata_unchanged check this run
+        self._repo_listings = {}  # repo_url -> list of .meta filenames (None if the repository can't be listed)
+        self._installed_set_cache = None  # lowercased entry names in %LOCALAPPDATA%/PaxD, reset whenever a package folder is added or removed
+        self._depgraph = None  # dependency package -> set of parent packages, loaded lazily from .depgraph.json
+        self._resolutions = {}  # repo_url -> (resolution data, alias -> package name), fetched lazily by _fetch_resolution
+        # One pooled session for every repository request, so repeated requests reuse the TCP/TLS connection
+        self._session = requests.Session()
+        # Connection errors and transient gateway errors are retried a few times (with backoff) before giving up.
+        # raise_on_status=False hands back the last response once retries run out, so callers still see the real status code
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries))
+        self._session.headers.update(self.headers)
+        atexit.register(self._session.close)
+
         # Initialize extension system
         self.trigger_system = TriggerSystem()
         self.trigger_system.set_verbose_print(self._verbose_print)
         self.extension_manager = ExtensionManager(
-            os.path.dirname(__file__), 
+            PAXD_DIR, 
             self.trigger_system, 
             self._verbose_print
         )
@@ -775,40 +900,41 @@ class PaxD:
     def _verbose_print(self, message, color=Fore.LIGHTBLACK_EX, mode=0):
         """Print message only in verbose mode with timestamp. (still log incase of exception, for Sentry, to provide more context)
         
+        message can also be a zero-argument callable (e.g. a lambda returning an f-string) for expensive messages:
+        it is only called when the message is actually printed, and is logged as-is otherwise.
+        
         NOTE: mode is an old parameter, but still exists for compatability!"""
         
         if mode == 0 or mode == 1:
             # Normal mode
-            import datetime
-            timestamp = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
+            logged_at = time.time()
             
-            # Get the lexicographic position BEFORE adding to the dict
-            current_count = len(LOGS_VERBOSE)
-            lexicographic_number = convert_to_lexicographic_position(current_count)
-            
-            LOGS_VERBOSE[f"({lexicographic_number}) {timestamp}"] = message # Also include the len of LOGS_VERBOSE so logs made at the exact same time are still valid and shown, instead of just the most recent one
+            # Appending keeps the logs in order, and the sequence number keeps logs made at the exact same time apart.
+            # The raw time is stored - it's only formatted when actually printed
+            LOGS_VERBOSE.append((len(LOGS_VERBOSE), logged_at, message))
             if self.verbose:
+                timestamp = datetime.datetime.fromtimestamp(logged_at).strftime("%H:%M:%S.%f")[:-3]
+                if callable(message):
+                    message = message()
                 print(f"{color}[{timestamp}] VERBOSE: {message}{Style.RESET_ALL}")
     
     def _verbose_timing_start(self, operation):
         """Start timing an operation in verbose mode."""
         if self.verbose:
-            import time
-            self._timing_start = time.time()
+            self._timing_start = time.perf_counter()
             self._verbose_print(f"Starting operation: {operation}", Fore.CYAN)
     
     def _verbose_timing_end(self, operation):
         """End timing an operation in verbose mode."""
         if self.verbose:
-            import time
             if hasattr(self, '_timing_start'):
-                elapsed = time.time() - self._timing_start
+                elapsed = time.perf_counter() - self._timing_start
                 self._verbose_print(f"Completed operation: {operation} (took {elapsed:.3f}s)", Fore.GREEN)
 
     def _check_if_extension(self, name: str) -> bool:
         """Check if a given name matches an installed extension"""
         try:
-            extensions_dir = os.path.join(os.path.dirname(__file__), "extensions")
+            extensions_dir = os.path.join(PAXD_DIR, "extensions")
             if not os.path.exists(extensions_dir):
                 return False
             
@@ -866,6 +992,8 @@ class PaxD:
 
     def _read_repository_url(self):
         """Read the repository URL from the repository file."""
+        if self._repo_url_cache is not None:
+            return self._repo_url_cache
         self._verbose_print(f"Checking repository file exists: {self.repository_file}")
         if not os.path.exists(self.repository_file):
             self._verbose_print(f"Repository file not found at: {self.repository_file}")
@@ -875,10 +1003,26 @@ class PaxD:
         with open(self.repository_file, 'r') as f:
             url = f.read().strip()
         self._verbose_print(f"Repository URL read: {url}")
+        if url.startswith("optimised::"):
+            # Already resolved when it was optimised - strip the marker here and record it as resolved to itself,
+            # so _resolve_repository_url answers from its cache without any redirect handling
+            url = url[len("optimised::"):].rstrip("/")
+            self._verbose_print(f"Repository URL is optimised, using '{url}' as-is")
+            PaxD._resolved_repo_urls[url] = url
+        PaxD._repo_url_cache = url
         return url
     
     def _resolve_repository_url(self, repo_url):
         """Resolve repository URL by following redirects and return the final URL."""
+        if repo_url in self._resolved_repo_urls:
+            self._verbose_print(f"Using already resolved repository URL for: {repo_url}")
+            return self._resolved_repo_urls[repo_url]
+        resolved = self._resolve_repository_url_uncached(repo_url)
+        self._resolved_repo_urls[repo_url] = resolved
+        return resolved
+
+    def _resolve_repository_url_uncached(self, repo_url):
+        """Follow redirects for a repository URL without consulting the resolution cache."""
         self._verbose_print(f"Resolving repository URL: {repo_url}")
         if repo_url.startswith("optimised::"):
             self._verbose_print("Repository URL is optimised - no resolution needed!")
@@ -890,21 +1034,24 @@ class PaxD:
             self._verbose_print(f"Trimmed optimised::, the url 'optimised::{repo_url}' has became '{repo_url}' and is being returned.")
             return repo_url
         try:
-            # Make a HEAD request to check for redirects without downloading content
-            self._verbose_print("Making HEAD request to check for redirects")
-            response = requests.head(repo_url, headers=self.headers, allow_redirects=True, timeout=10) # type: ignore
-            self._verbose_print(f"HEAD {repo_url}: {response.status_code}")
-            self._verbose_print(f"HEAD request completed, final URL: {response.url}")
-
-            # If we were redirected, keep repeating the previous logic until we get to a point we arent redirected
-            if response.url != repo_url:
+            # Keep following redirects until we get to a point we arent redirected (bounded, in case a server redirects in a loop)
+            seen = set()
+            while len(seen) < 10 and repo_url not in seen:
+                seen.add(repo_url)
+                # Make a HEAD request to check for redirects without downloading content
+                self._verbose_print("Making HEAD request to check for redirects")
+                response = self._session.head(repo_url, allow_redirects=True, timeout=10) # type: ignore
+                self._verbose_print(f"HEAD {repo_url}: {response.status_code}")
+                self._verbose_print(f"HEAD request completed, final URL: {response.url}")
+                if response.url == repo_url:
+                    break
                 self._verbose_print(f"Redirect detected: {repo_url} -> {response.url}, starting new iteration...")
-                return self._resolve_repository_url(response.url)
+                repo_url = response.url
             
             if repo_url.endswith("/"):
                 self._verbose_print("Removing trailing slash from URL")
                 repo_url = repo_url[:-1]
-            self._verbose_print(f"Final resolved URL (for this iteration): {repo_url}")
+            self._verbose_print(f"Final resolved URL: {repo_url}")
             return repo_url
         except Exception as e:
             # If resolution fails, fall back to original URL
@@ -915,73 +1062,84 @@ class PaxD:
                 repo_url = repo_url[:-1]
             return repo_url
     
-    def _fetch_package_metadata(self, repo_url, package_name):
-        """Fetch package metadata, trying package.yaml first, then paxd.yaml, then legacy paxd JSONC."""
+    def _fetch_package_metadata(self, repo_url, package_name, parallel=True):
+        """Fetch package metadata, trying package.yaml first, then paxd.yaml, then legacy paxd JSONC.
+
+        Callers that already fetch many packages from their own thread pool pass parallel=False, so the candidate
+        files are requested one at a time instead of nesting another pool on top of the shared HTTP session."""
         self._verbose_print(f"Fetching package metadata for: {package_name}")
-        
-        # First try the preferred package.yaml file
-        yaml_url = f"{repo_url}/packages/{package_name}/package.yaml"
-        self._verbose_print(f"Trying package.yaml file at: {yaml_url}")
+        cached = self._load_metadata_cache(package_name)
 
-        try:
-            yaml_response = requests.get(yaml_url, headers=self.headers, allow_redirects=True)  # type: ignore
-            self._verbose_print(f"GET {yaml_url}: {yaml_response.status_code}")
-
-            if yaml_response.status_code == 200:
-                self._verbose_print("Found package.yaml file, parsing as YAML")
-                yaml_data = yaml.safe_load(yaml_response.text)
-                if not yaml_data:
-                    raise ValueError("YAML file appears to be empty or invalid")
-                
-                # Convert YAML to paxd manifest format using compiler code
-                self._verbose_print("Converting YAML to paxd manifest format")
-                package_data = compile_paxd_manifest(yaml_data)
-                self._verbose_print("Successfully converted YAML to paxd format")
-                return package_data, "package.yaml"
-        except Exception as e:
-            self._verbose_print(f"Failed to fetch or parse package.yaml file: {e}")
-        
-        # If package.yaml not found or failed, try paxd.yaml
-        yaml_url2 = f"{repo_url}/packages/{package_name}/paxd.yaml"
-        self._verbose_print(f"Trying paxd.yaml file at: {yaml_url2}")
-        
-        try:
-            yaml_response = requests.get(yaml_url2, headers=self.headers, allow_redirects=True)  # type: ignore
-            self._verbose_print(f"GET {yaml_url2}: {yaml_response.status_code}")
-            
-            if yaml_response.status_code == 200:
-                self._verbose_print("Found paxd.yaml file, parsing as YAML")
-                yaml_data = yaml.safe_load(yaml_response.text)
-                if not yaml_data:
-                    raise ValueError("YAML file appears to be empty or invalid")
-                
-                # Convert YAML to paxd manifest format using compiler code
-                self._verbose_print("Converting YAML to paxd manifest format")
-                package_data = compile_paxd_manifest(yaml_data)
-                self._verbose_print("Successfully converted YAML to paxd format")
-                return package_data, "paxd.yaml"
-        except Exception as e:
-            self._verbose_print(f"Failed to fetch or parse paxd.yaml file: {e}")
+        def parse_yaml_manifest(text):
+            import yaml # type: ignore (yaml is in paxd file dependencies)
+            # libyaml's C loader is much faster than the pure Python one, but only exists if PyYAML was built with it
+            loader = getattr(yaml, "CSafeLoader", None)
+            if loader is None:
+                self._verbose_print("libyaml not available, using the pure Python YAML loader")
+                loader = yaml.SafeLoader
+            yaml_data = yaml.load(text, Loader=loader)
+            if not yaml_data:
+                raise ValueError("YAML file appears to be empty or invalid")
+            # Convert YAML to paxd manifest format using compiler code
+            self._verbose_print("Converting YAML to paxd manifest format")
+            return compile_paxd_manifest(yaml_data)
 
-        # Finally, try the legacy paxd JSONC file
-        package_url = f"{repo_url}/packages/{package_name}/paxd"
-        self._verbose_print(f"Trying legacy paxd file at: {package_url}")
-        
+        # Use the preferred package.yaml file, then paxd.yaml, then the legacy paxd JSONC file (requesting all 3 at once when parallel)
+        candidates = (("package.yaml", parse_yaml_manifest), ("paxd.yaml", parse_yaml_manifest), ("paxd", parse_jsonc))
+
+        def fetch(source_file):
+            url = f"{repo_url}/packages/{package_name}/{source_file}"
+            self._verbose_print(f"Trying {source_file} file at: {url}")
+            headers = self.headers
+            if cached and cached.get("url") == url:
+                # We have this file cached - only download it again if it changed
+                headers = {**self.headers, "If-None-Match": cached["etag"]}
+            response = self._session.get(url, headers=headers, allow_redirects=True)  # type: ignore
+            self._verbose_print(f"GET {url}: {response.status_code}")
+            return url, response
+
+        executor = None
+        if parallel:
+            from concurrent.futures import ThreadPoolExecutor
+            executor = ThreadPoolExecutor(max_workers=len(candidates))
+            futures = {source_file: executor.submit(fetch, source_file) for source_file, _ in candidates}
+            def get_response(source_file):
+                return futures[source_file].result()
+        else:
+            responses = {}
+            def get_response(source_file):
+                if source_file not in responses:
+                    responses[source_file] = fetch(source_file)
+                return responses[source_file]
         try:
-            package_response = requests.get(package_url, headers=self.headers, allow_redirects=True)  # type: ignore
-            self._verbose_print(f"GET {package_url}: {package_response.status_code}")
-            
-            if package_response.status_code == 200:
-                self._verbose_print("Found paxd file, parsing as JSONC")
-                package_data = parse_jsonc(package_response.text)
-                self._verbose_print("Successfully parsed paxd file")
-                return package_data, "paxd"
-        except Exception as e:
-            self._verbose_print(f"Failed to fetch or parse paxd file: {e}")
-        
-        # If all 3 files failed, check if it's a 404 and provide a friendly error
+            for source_file, parser in candidates:
+                try:
+                    url, response = get_response(source_file)
+
+                    if response.status_code == 304 and cached:
+                        self._verbose_print(f"{source_file} not modified, using cached metadata")
+                        self._metadata_etags[package_name] = (url, cached["etag"])
+                        return cached["data"], source_file
+                    if response.status_code == 200:
+                        self._verbose_print(f"Found {source_file} file, parsing")
+                        package_data = parser(response.text)
+                        self._verbose_print(f"Successfully parsed {source_file} file")
+                        etag = response.headers.get("ETag")
+                        self._metadata_etags[package_name] = (url, etag)
+                        if etag:
+                            self._store_metadata_cache(package_name, {"url": url, "etag": etag, "data": package_data})
+                        return package_data, source_file
+                except Exception as e:
+                    self._verbose_print(f"Failed to fetch or parse {source_file} file: {e}")
+        finally:
+            if executor is not None:
+                # Don't hold the caller up waiting on lower-priority files we no longer need. Their requests are already
+                # in flight (one worker per candidate) and can't be cancelled, so they finish in the background and are discarded
+                executor.shutdown(wait=False)
+        
+        # If all 3 files failed, check if it's a 404 and provide a friendly error (reusing the response we already got for paxd)
         self._verbose_print("package.yaml, paxd.yaml and paxd files failed, checking error type")
-        package_response = requests.get(package_url, headers=self.headers, allow_redirects=True)  # type: ignore
+        _, package_response = get_response("paxd")
         
         if package_response.status_code == 404:
             # Package not found - provide a user-friendly error
@@ -994,6 +1152,228 @@ class PaxD:
         # This shouldn't be reached, but just in case
         raise PackageNotFoundError(f"Could not find package metadata for {package_name}")
 
+    def _metadata_cache_file(self, package_name):
+        return os.path.join(self.local_app_data, ".metacache", f"{package_name}.json")
+
+    def _load_metadata_cache(self, package_name):
+        """Load the cached {url, etag, data} for a package's metadata, or None if there isn't a usable one."""
+        try:
+            with open(self._metadata_cache_file(package_name), 'r') as f:
+                cached = json.load(f)
+            return cached if cached.get("url") and cached.get("etag") and "data" in cached else None
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def _store_metadata_cache(self, package_name, entry):
+        """Save a package's parsed metadata with its ETag, so the next fetch can be a conditional GET."""
+        cache_file = self._metadata_cache_file(package_name)
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            _atomic_write(cache_file, json.dumps(entry))
+        except (OSError, TypeError, ValueError) as e:
+            # TypeError: YAML can produce values JSON can't hold (e.g. dates) - just don't cache those
+            self._verbose_print(f"Failed to cache metadata for {package_name}: {e}")
+
+    def _save_metadata_etag(self, package_name, package_install_path, version):
+        """Persist the ETag of the last metadata fetch for a package (with the version installed from it), so later updates can ask if anything changed."""
+        metadata_url, etag = self._metadata_etags.get(package_name, (None, None))
+        etag_file = os.path.join(package_install_path, ".ETAG")
+        self._metadata_unchanged_results.pop(package_name, None)
+        if metadata_url and etag:
+            _atomic_write(etag_file, f"{metadata_url}\n{etag}\n{version}")
+            self._verbose_print(f"Saved metadata ETag for {package_name}: {etag}")
+        elif os.path.exists(etag_file):
+            # The repository stopped sending an ETag - don't keep trusting a stale one
+            os.remove(etag_file)
+
+    def _metadata_unchanged(self, package_name, package_install_path):
+        """Check with a conditional GET whether a package's metadata is unchanged since its last install/update."""
+        if package_name in self._metadata_unchanged_results:
+            return self._metadata_unchanged_results[package_name]
+
+        etag_file = os.path.join(package_install_path, ".ETAG")
+        try:
+            with open(etag_file, 'r') as f:
+                metadata_url, etag, etag_version = f.read().split('\n', 2)
+        except (FileNotFoundError, ValueError):
+            self._verbose_print(f"No stored metadata ETag for {package_name}")
+            return False
+
+        # The ETag only vouches for the version installed from it - if .VERSION says otherwise (a failed or manual update), check properly
+        try:
+            installed_version = PathLib(package_install_path, ".VERSION").read_text().strip()
+        except FileNotFoundError:
+            installed_version = None
+        if installed_version != etag_version:
+            self._verbose_print(f"Stored metadata ETag for {package_name} is for version {etag_version}, but {installed_version} is installed - can't use it")
+            self._metadata_unchanged_results[package_name] = False
+            return False
+
+        # A 304 only says that one file is unchanged. It can only be trusted for the highest priority manifest in the current
+        # repository - an ETag for a legacy paxd/paxd.yaml file (a package.yaml may have been added since) or for another
+        # repository (the user may have switched) says nothing about what _fetch_package_metadata would use now
+        repo_url = self._resolve_repository_url(self._read_repository_url())
+        if metadata_url != f"{repo_url}/packages/{package_name}/package.yaml":
+            self._verbose_print(f"Stored metadata ETag for {package_name} is for {metadata_url}, not the current package.yaml - can't use it")
+            self._metadata_unchanged_results[package_name] = False
+            return False
+
+        try:
+            response = self._session.get(metadata_url, headers={**self.headers, "If-None-Match": etag}, allow_redirects=True)  # type: ignore
+            self._verbose_print(f"GET {metadata_url} (If-None-Match: {etag}): {response.status_code}")
+        except requests.RequestException as e:
+            self._verbose_print(f"Conditional metadata request failed: {e}")
+            return False
+        self._metadata_unchanged_results[package_name] = response.status_code == 304
+        return self._metadata_unchanged_results[package_name]
+
+    def _http_cache_file(self, url):
+        # One file per URL (named by its hash, URLs aren't valid file names), so refreshing one never rewrites the others
+        import hashlib
+        return os.path.join(self.local_app_data, ".metacache", "http", f"{hashlib.sha256(url.encode()).hexdigest()}.json")
+
+    def _load_http_cache(self, url):
+        """Load the cached {etag, last_modified, fetched_at, data} for a repository file, or None if there isn't one."""
+        try:
+            with open(self._http_cache_file(url), 'r') as f:
+                cached = json.load(f)
+            return cached if "data" in cached else None
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _store_http_cache(self, url, entry):
+        """Save a repository file's parsed response with its validators, so the next fetch can be a conditional GET."""
+        cache_file = self._http_cache_file(url)
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            _atomic_write(cache_file, json.dumps(entry))
+        except (OSError, TypeError, ValueError) as e:
+            # TypeError: a parser can return values JSON can't hold - just don't cache those
+            self._verbose_print(f"Failed to cache {url}: {e}")
+
+    def _run_external_installs(self, external_installs):
+        """Run (dep, argv) winget/choco/npm installs, returning (dep, return code, exception) for each in order.
+
+        Installs through the same manager run one after another (winget/MSI and choco both lock during an install),
+        only different managers run in parallel."""
+        if not external_installs:
+            return []
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Installer agreements/prompts are only auto-accepted if the user opted in with PAXD_ACCEPT_AGREEMENTS=1
+        accept_agreements = os.getenv("PAXD_ACCEPT_AGREEMENTS", None) == "1"
+        accept_flags = {"winget": ["--accept-package-agreements", "--accept-source-agreements"], "choco": ["-y"]}
+
+        by_manager = {}  # manager -> [(position in external_installs, dep, argv)]
+        for position, (dep, command) in enumerate(external_installs):
+            if accept_agreements:
+                command = command + accept_flags.get(command[0], [])
+            by_manager.setdefault(command[0], []).append((position, dep, command))
+
+        def run_manager_installs(installs):
+            outcomes = []
+            for position, dep, command in installs:
+                try:
+                    # Output is captured so parallel managers don't interleave (undecodable bytes are replaced, not fatal).
+                    # No shell: package names go to the installer as plain arguments. shutil.which resolves e.g. npm to npm.cmd on Windows
+                    completed = subprocess.run([shutil.which(command[0]) or command[0]] + command[1:],
+                                               capture_output=True, text=True, errors="replace", stdin=subprocess.DEVNULL)
+                    outcomes.append((position, dep, command[0], completed, None))
+                except Exception as e:
+                    outcomes.append((position, dep, command[0], None, e))
+            return outcomes
+
+        with ThreadPoolExecutor(max_workers=len(by_manager)) as executor:
+            outcomes = [outcome for future in [executor.submit(run_manager_installs, installs) for installs in by_manager.values()]
+                        for outcome in future.result()]
+
+        results = []
+        for position, dep, installer, completed, error in sorted(outcomes, key=lambda outcome: outcome[0]):
+            if isinstance(error, FileNotFoundError):
+                # Same outcome as the shell's "not recognized" error used to be: report it, but don't fail the install
+                print(f"{Fore.RED}Could not install '{dep}': {installer} was not found on PATH")
+                results.append((dep, None, None))
+                continue
+            if error is not None:
+                results.append((dep, None, error))
+                continue
+            # Show each install's output in one piece, in dependency order
+            print(f"{Fore.CYAN}--- {dep} ---{Style.RESET_ALL}")
+            if completed.stdout:
+                print(completed.stdout, end="" if completed.stdout.endswith("\n") else "\n")
+            if completed.stderr:
+                print(completed.stderr, end="" if completed.stderr.endswith("\n") else "\n", file=sys.stderr)
+            if completed.returncode != 0 and not accept_agreements and installer in accept_flags:
+                print(f"{Fore.YELLOW}If {installer} needed you to accept an agreement, accept it by running it yourself, or set PAXD_ACCEPT_AGREEMENTS=1 to let PaxD accept them for you.")
+            results.append((dep, completed.returncode, None))
+        return results
+
+    def _fetch_resolution(self, repo_url):
+        """Fetch a repository's resolution data (once per run, revalidated against the HTTP cache), along with an alias -> package name index built from it."""
+        if repo_url not in self._resolutions:
+            resolution_url = f"{repo_url}/resolution"
+            self._verbose_print(f"Fetching resolution data from: {resolution_url}")
+            # Conditional GET against the on-disk HTTP cache - an unchanged resolution file comes back as a bodyless 304
+            resolution_data = self._cached_get_parsed(resolution_url, parse_jsonc)
+            alias_index = {}
+            for actual_package, aliases in resolution_data.items():
+                for alias in aliases:
+                    # setdefault keeps the first package listing an alias, as the old linear search did
+                    alias_index.setdefault(alias, actual_package)
+            self._resolutions[repo_url] = (resolution_data, alias_index)
+        return self._resolutions[repo_url]
+
+    def _cached_get_parsed(self, url, parser):
+        """GET a repository file and parse it, reusing the cached parse if the server answers 304 Not Modified."""
+        entry = self._load_http_cache(url)
+        headers = dict(self.headers)
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self._session.get(url, headers=headers, allow_redirects=True)  # type: ignore
+        self._verbose_print(f"GET {url}: {response.status_code}")
+        if response.status_code == 304 and entry:
+            self._verbose_print(f"Not modified, using cached copy of {url} (fetched {time.time() - entry.get('fetched_at', 0):.0f}s ago)")
+            return entry["data"]
+        response.raise_for_status()
+
+        data = parser(response.text)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._store_http_cache(url, {"etag": etag, "last_modified": last_modified, "fetched_at": time.time(), "data": data})
+        return data
+
+    def _list_repo_packages(self, repo_url):
+        """List the metapackage files in a repository with a single request, or return None if it can't be listed."""
+        if repo_url in self._repo_listings:
+            return self._repo_listings[repo_url]
+
+        listing = None
+        # Raw GitHub URLs look like https://raw.githubusercontent.com/<owner>/<repo>/[refs/heads/]<ref>
+        prefix = "https://raw.githubusercontent.com/"
+        if repo_url.startswith(prefix):
+            parts = repo_url[len(prefix):].split("/")
+            if len(parts) >= 3:
+                owner, repo, ref = parts[0], parts[1], "/".join(parts[2:])
+                if ref.startswith("refs/heads/") or ref.startswith("refs/tags/"):
+                    ref = ref.split("/", 2)[2]
+                api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/packages/metapackages?ref={ref}"
+                self._verbose_print(f"Listing metapackages via GitHub API: {api_url}")
+                try:
+                    entries = self._cached_get_parsed(api_url, json_loads)
+                    listing = [entry["name"] for entry in entries if entry.get("type") == "file" and entry["name"].endswith(".meta")]
+                except Exception as e:
+                    self._verbose_print(f"Failed to list metapackages: {e}")
+        else:
+            self._verbose_print(f"Repository {repo_url} is not hosted on GitHub, metapackages can't be listed")
+
+        self._repo_listings[repo_url] = listing
+        return listing
+
     def _is_metapackage(self, package_name):
         """Check if a package name refers to a metapackage."""
         return package_name.endswith('.meta')
@@ -1012,14 +1392,14 @@ class PaxD:
         self._verbose_print(f"Trying metapackage file at: {meta_url}")
         
         try:
-            meta_response = requests.get(meta_url, headers=self.headers, allow_redirects=True)  # type: ignore
+            meta_response = self._session.get(meta_url, allow_redirects=True)  # type: ignore
             self._verbose_print(f"GET {meta_url}: {meta_response.status_code}")
             
             if meta_response.status_code == 200:
                 self._verbose_print("Found metapackage file, parsing content")
                 # Parse the content as a list of package names (one per line)
                 package_list = [line.strip() for line in meta_response.text.strip().split('\n') if line.strip()]
-                self._verbose_print(f"Metapackage contains {len(package_list)} packages: {package_list}")
+                self._verbose_print(lambda: f"Metapackage contains {len(package_list)} packages: {package_list}")
                 return package_list
             else:
                 meta_response.raise_for_status()
@@ -1052,13 +1432,13 @@ class PaxD:
         self._verbose_print("Reading and resolving repository URL")
         repo_url = self._read_repository_url()
         repo_url = self._resolve_repository_url(repo_url)
-        local_app_data = os.path.join(os.path.expandvars(r"%LOCALAPPDATA%"), "PaxD")
+        local_app_data = self.local_app_data
         self._verbose_print(f"Local app data directory: {local_app_data}")
         
         # GET {repo_url}/paxd - this validates that the URL is a valid paxd repo
         paxd_url = f"{repo_url}/paxd"
         self._verbose_print(f"Validating repository at: {paxd_url}")
-        response = requests.get(paxd_url, headers=self.headers, allow_redirects=True)  # type: ignore
+        response = self._session.get(paxd_url, allow_redirects=True)  # type: ignore
         self._verbose_print(f"GET {paxd_url}: {response.status_code}")
         self._verbose_print(f"Repository validation response: {response.status_code}")
         
@@ -1147,9 +1527,7 @@ class PaxD:
                 tracking_name = package_name[:-5] if package_name.endswith('.meta') else package_name
                 tracking_file = os.path.join(metapackage_tracking_dir, f"{tracking_name}.installed")
                 
-                with open(tracking_file, 'w') as f:
-                    for pkg in installed_packages:  # Only newly installed packages
-                        f.write(f"{pkg}\n")
+                PathLib(tracking_file).write_text("".join(f"{pkg}\n" for pkg in installed_packages))  # Only newly installed packages
                 self._verbose_print(f"Created metapackage tracking file: {tracking_file}")
                 
                 if already_installed_packages:
@@ -1174,25 +1552,16 @@ class PaxD:
             return
 
         # GET {repo_url}/resolution
-        resolution_url = f"{repo_url}/resolution"
-        self._verbose_print(f"Fetching resolution data from: {resolution_url}")
-        resolution_response = requests.get(resolution_url, headers=self.headers, allow_redirects=True)  # type: ignore
-        self._verbose_print(f"GET {resolution_url}: {resolution_response.status_code}")
-        self._verbose_print(f"Resolution response status: {resolution_response.status_code}")
-        resolution_response.raise_for_status()
-        resolution_data = parse_jsonc(resolution_response.text)
+        resolution_data, alias_index = self._fetch_resolution(repo_url)
         self._verbose_print(f"Resolution data contains {len(resolution_data)} packages")
         
         # Check if package name needs to be resolved from alias to actual package name
         self._verbose_print(f"Checking if '{package_name}' is an alias")
-        resolved_package = None
-        for actual_package, aliases in resolution_data.items():
-            if package_name in aliases:
-                resolved_package = actual_package
-                self._verbose_print(f"Alias '{package_name}' resolved to '{resolved_package}'")
-                print(f"Resolving alias '{package_name}' to '{resolved_package}'")
-                package_name = resolved_package
-                break
+        resolved_package = alias_index.get(package_name)
+        if resolved_package is not None:
+            self._verbose_print(f"Alias '{package_name}' resolved to '{resolved_package}'")
+            print(f"Resolving alias '{package_name}' to '{resolved_package}'")
+            package_name = resolved_package
         
         if resolved_package is None:
             self._verbose_print(f"'{package_name}' is not an alias, using as direct package name")
@@ -1200,12 +1569,17 @@ class PaxD:
         # Check if package is already installed
         package_install_path = os.path.join(local_app_data, package_name)
         self._verbose_print(f"Checking if package already installed at: {package_install_path}")
-        if os.path.exists(package_install_path):
+        # One directory listing answers both "is it installed?" and "was it user-installed?"
+        try:
+            with os.scandir(package_install_path) as entries:
+                installed_entries = {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            installed_entries = None
+        if installed_entries is not None:
             self._verbose_print("Package directory already exists")
             
             # Check current installation status
-            user_installed_file = os.path.join(package_install_path, ".USER_INSTALLED")
-            is_currently_user_installed = os.path.exists(user_installed_file)
+            is_currently_user_installed = ".USER_INSTALLED" in installed_entries
             
             if user_requested:
                 # User is manually installing a package that already exists
@@ -1234,7 +1608,7 @@ class PaxD:
         # Check if package has an IMPORTANT file, if so, print it
         important_file_url = f"{repo_url}/packages/{package_name}/IMPORTANT"
         self._verbose_print(f"Checking for IMPORTANT file at: {important_file_url}")
-        important_response = requests.get(important_file_url, headers=self.headers, allow_redirects=True)  # type: ignore
+        important_response = self._session.get(important_file_url, allow_redirects=True)  # type: ignore
         self._verbose_print(f"GET {important_file_url}: {important_response.status_code}")
         if important_response.status_code == 200:
             self._verbose_print("IMPORTANT file found, displaying to user")
@@ -1255,14 +1629,15 @@ class PaxD:
             print(f"{Fore.GREEN}Found YAML package configuration, converted to paxd format")
 
         pkg_name_friendly = f"{Fore.GREEN}{package_data.get('pkg_info', {}).get('pkg_name', package_name)}{Style.RESET_ALL}, by {Fore.MAGENTA}{package_data.get('pkg_info', {}).get('pkg_author', 'Unknown Author')}{Style.RESET_ALL} ({Fore.BLUE}{package_data.get('pkg_info', {}).get('pkg_version', 'Unknown Version')}{Style.RESET_ALL})"
-        self._verbose_print(f"Package info: {package_data.get('pkg_info', {})}")
+        self._verbose_print(lambda: f"Package info: {package_data.get('pkg_info', {})}")
         print(f"{Fore.GREEN}Retrieved package metadata for '{pkg_name_friendly}'")
 
         # Install dependencies and track them
         dependencies = set()
         dep_list = package_data.get("install", {}).get("depend", [])
-        self._verbose_print(f"Package has {len(dep_list)} dependencies: {dep_list}")
+        self._verbose_print(lambda: f"Package has {len(dep_list)} dependencies: {dep_list}")
         
+        external_installs = []  # (dep, argv) for winget/choco/npm - run in parallel once the loop is done
         for dep in dep_list:
             dependencies.add(dep)
             self._verbose_print(f"Processing dependency: {dep}")
@@ -1280,22 +1655,19 @@ class PaxD:
                     winget_package = dep[len("winget:"):]
                     self._verbose_print(f"Installing winget package: {winget_package}")
                     print(f"{Fore.CYAN}Installing Windows package '{Fore.YELLOW}{winget_package}{Fore.CYAN}' via winget")
-                    result = os.system(f"winget install {winget_package}")
-                    self._verbose_print(f"Winget install result code: {result}")
+                    external_installs.append((dep, ["winget", "install", winget_package, "--disable-interactivity"]))
                 # Dependency begins with "choco:": use choco to install
                 elif dep.startswith("choco:"):
                     choco_package = dep[len("choco:"):]
                     self._verbose_print(f"Installing choco package: {choco_package}")
                     print(f"{Fore.CYAN}Installing Chocolatey package '{Fore.YELLOW}{choco_package}{Fore.CYAN}' via choco")
-                    result = os.system(f"choco install {choco_package}")
-                    self._verbose_print(f"Choco install result code: {result}")
+                    external_installs.append((dep, ["choco", "install", choco_package]))
                 # Dependency begins with "npm:": use npm to install
                 elif dep.startswith("npm:"):
                     npm_package = dep[len("npm:"):]
                     self._verbose_print(f"Installing npm package: {npm_package}")
                     print(f"{Fore.CYAN}Installing Node.js package '{Fore.YELLOW}{npm_package}{Fore.CYAN}' via npm")
-                    result = os.system(f"npm install {npm_package}")
-                    self._verbose_print(f"NPM install result code: {result}")
+                    external_installs.append((dep, ["npm", "install", npm_package]))
                 # Dependency begins with "paxd:": call self.install on the package
                 elif dep.startswith("paxd:"):
                     paxd_package = dep[len("paxd:"):]
@@ -1315,6 +1687,12 @@ class PaxD:
             except Exception as e:
                 self._verbose_print(f"Failed to install dependency {dep}: {e}")
                 raise DependencyError(f"Failed to install dependency '{dep}': {e}")
+        
+        for dep, result, error in self._run_external_installs(external_installs):
+            if error is not None:
+                self._verbose_print(f"Failed to install dependency {dep}: {error}")
+                raise DependencyError(f"Failed to install dependency '{dep}': {error}")
+            self._verbose_print(f"{dep} install result code: {result}")
             
         if PIP_PACKAGES:
             # Install all at once
@@ -1329,36 +1707,25 @@ class PaxD:
 
         # For each file in package_data[install][include], GET that file and install (supporting relative paths like folder1/file2)
         include_files = package_data.get("install", {}).get("include", [])
-        self._verbose_print(f"Installing {len(include_files)} files: {include_files}")
+        self._verbose_print(lambda: f"Installing {len(include_files)} files: {include_files}")
         
+        files_to_install = []
         for file in include_files:
             self._verbose_print(f"Processing file: {file}")
             if file == "README.html":
                 self._verbose_print("Skipping auto-generated README.html file")
                 print(f"{Fore.RED}File is an auto-generated README.html file - skipping...")
                 continue
-                
-            file_url = f"{repo_url}/packages/{package_name}/src/{file}"
-            self._verbose_print(f"Downloading file from: {file_url}")
-            file_response = requests.get(file_url, headers=self.headers, allow_redirects=True)  # type: ignore
-            self._verbose_print(f"GET {file_url}: {file_response.status_code}")
-            self._verbose_print(f"File download response: {file_response.status_code}")
-            file_response.raise_for_status()
-            file_data = file_response.content
-            self._verbose_print(f"Downloaded {len(file_data)} bytes")
-            
-            # Actually install this file to %LOCALAPPDATA%/<package_name>/{file}
-            install_path = os.path.join(local_app_data, package_name, file)
-            self._verbose_print(f"Installing file to: {install_path}")
-            os.makedirs(os.path.dirname(install_path), exist_ok=True)
-            with open(install_path, 'wb') as f:
-                f.write(file_data)
-            self._verbose_print(f"Successfully wrote file to disk")
-            
-            # Small delay to ensure file write is completely flushed
-            import time
-            time.sleep(0.2)
-            
+            files_to_install.append(file)
+        
+        # Downloading is network bound, so fetch and write every file at once, then verify them one by one in order
+        # (a failed verification removes the whole package, which must not race with the other files)
+        self._installed_set_cache = None
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            downloaded_files = list(executor.map(lambda file: self._download_package_file(repo_url, package_name, file), files_to_install))
+        
+        for file, (install_path, file_data) in zip(files_to_install, downloaded_files):
             # Check if this file has a checksum at package_data[install][checksum], if so, verify it with retry mechanism
             expected_checksum = package_data.get("install", {}).get("checksum", {}).get(file)
             self._verbose_print(f"Looking for checksum for file '{file}'")
@@ -1388,15 +1755,14 @@ class PaxD:
         mainfile = package_data.get("install", {}).get("mainfile")
         self._verbose_print(f"Mainfile: {mainfile}")
         if mainfile:
-            alias = package_data.get("install", {}).get("alias", mainfile.split(".")[0])
+            alias = package_data.get("install", {}).get("alias", mainfile.partition(".")[0])
             self._verbose_print(f"Creating batch file with alias: {alias}")
-            bat_file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bin", f"{alias}.bat")
+            bat_file_path = os.path.join(BIN_DIR, f"{alias}.bat")
             self._verbose_print(f"Batch file path: {bat_file_path}")
             if not os.path.exists(bat_file_path):
                 self._verbose_print("Creating new batch file")
                 with open(bat_file_path, 'w') as f:
-                    f.write(f"@echo off\n")
-                    f.write(f'"{sys.executable}" "{os.path.join(local_app_data, "com.mralfiem591.paxd", "run_pkg.py")}" "{os.path.join(local_app_data, package_name, mainfile)}" %*\n')
+                    f.write(f'@echo off\n"{sys.executable}" "{RUN_PKG_PATH}" "{os.path.join(local_app_data, package_name, mainfile)}" %*\n')
                 print(f"Created batch file at {bat_file_path}")
             else:
                 self._verbose_print("Batch file already exists, skipping creation")
@@ -1405,15 +1771,13 @@ class PaxD:
         version_file = os.path.join(local_app_data, package_name, ".VERSION")
         installed_version = package_data.get('pkg_info', {}).get('pkg_version', 'Unknown')
         self._verbose_print(f"Creating version file: {version_file} with version: {installed_version}")
-        with open(version_file, 'w') as f:
-            f.write(installed_version)
+        PathLib(version_file).write_text(installed_version)
+        self._save_metadata_etag(package_name, os.path.join(local_app_data, package_name), installed_version)
         
         # Save dependencies for future cleanup tracking
         deps_file = os.path.join(local_app_data, package_name, ".DEPENDENCIES")
         self._verbose_print(f"Saving {len(dependencies)} dependencies to: {deps_file}")
-        with open(deps_file, 'w') as f:
-            for dep in sorted(dependencies):
-                f.write(f"{dep}\n")
+        PathLib(deps_file).write_text("".join(f"{dep}\n" for dep in sorted(dependencies)))
         
         # Mark as user-installed if requested by user (not as dependency)
         if user_requested:
@@ -1436,7 +1800,7 @@ class PaxD:
         self._verbose_timing_start(f"uninstall {package_name}")
         self._verbose_print(f"Uninstalling package: {package_name}")
         
-        if package_name.lower() == ".metapackages" or package_name.lower() == "extensions":
+        if package_name.lower() in (".metapackages", ".metacache", "extensions"):
             print(f"{Fore.RED}X Cannot uninstall reserved package name: {Fore.YELLOW}{package_name}")
             return
         
@@ -1449,7 +1813,7 @@ class PaxD:
         self._verbose_print("Reading and resolving repository URL for uninstall")
         repo_url = self._read_repository_url()
         repo_url = self._resolve_repository_url(repo_url)
-        local_app_data = os.path.join(os.path.expandvars(r"%LOCALAPPDATA%"), "PaxD")
+        local_app_data = self.local_app_data
         self._verbose_print(f"Local app data directory: {local_app_data}")
         
         # Check if this is a metapackage
@@ -1486,8 +1850,7 @@ class PaxD:
             packages_to_check = package_list
             if os.path.exists(tracking_file):
                 # Use the tracking file to know exactly which packages were installed by this metapackage
-                with open(tracking_file, 'r') as f:
-                    packages_to_check = [line.strip() for line in f if line.strip()]
+                packages_to_check = PathLib(tracking_file).read_text().split()
                 print(f"{Fore.CYAN}Found metapackage tracking file - checking {len(packages_to_check)} packages.")
             else:
                 print(f"{Fore.YELLOW}No metapackage tracking file found - checking all packages in metapackage.")
@@ -1499,7 +1862,6 @@ class PaxD:
             for pkg in packages_to_check:
                 try:
                     pkg_path = os.path.join(local_app_data, pkg)
-                    dependency_file = os.path.join(pkg_path, ".DEPENDENCY")
                     
                     if not os.path.exists(pkg_path):
                         print(f"{Fore.YELLOW}Skipping {Fore.CYAN}{pkg}{Fore.YELLOW} (not installed)")
@@ -1508,16 +1870,13 @@ class PaxD:
                     
                     # Check if package is still needed as a dependency by other packages
                     is_dependency_of_others = False
-                    if os.path.exists(dependency_file):
-                        with open(dependency_file, 'r') as f:
-                            dependent_packages = [line.strip() for line in f if line.strip()]
-                            # Check if any dependencies still exist
-                            for dep_pkg in dependent_packages:
-                                dep_pkg_path = os.path.join(local_app_data, dep_pkg)
-                                if os.path.exists(dep_pkg_path):
-                                    is_dependency_of_others = True
-                                    self._verbose_print(f"Package {pkg} is still needed by {dep_pkg}")
-                                    break
+                    # Check if any dependent packages still exist
+                    for dep_pkg in sorted(self._load_depgraph().get(pkg, ())):
+                        dep_pkg_path = os.path.join(local_app_data, dep_pkg)
+                        if os.path.exists(dep_pkg_path):
+                            is_dependency_of_others = True
+                            self._verbose_print(f"Package {pkg} is still needed by {dep_pkg}")
+                            break
                     
                     if not is_dependency_of_others:
                         print(f"{Fore.RED}Uninstalling package {Fore.YELLOW}{pkg}{Fore.RED}...")
@@ -1555,24 +1914,15 @@ class PaxD:
             return
 
         # GET {repo_url}/resolution
-        resolution_url = f"{repo_url}/resolution"
-        self._verbose_print(f"Fetching resolution data from: {resolution_url}")
-        resolution_response = requests.get(resolution_url, headers=self.headers, allow_redirects=True)  # type: ignore
-        self._verbose_print(f"GET {resolution_url}: {resolution_response.status_code}")
-        self._verbose_print(f"Resolution response status: {resolution_response.status_code}")
-        resolution_response.raise_for_status()
-        resolution_data = parse_jsonc(resolution_response.text)
+        resolution_data, alias_index = self._fetch_resolution(repo_url)
         self._verbose_print(f"Resolution data contains {len(resolution_data)} packages")
         
         # Check if package name needs to be resolved from alias to actual package name
         self._verbose_print(f"Checking if '{package_name}' is an alias")
-        resolved_package = None
-        for actual_package, aliases in resolution_data.items():
-            if package_name in aliases:
-                resolved_package = actual_package
-                print(f"{Fore.BLUE}Resolving alias '{Fore.YELLOW}{package_name}{Fore.BLUE}' to '{Fore.CYAN}{resolved_package}{Fore.BLUE}'")
-                package_name = resolved_package
-                break
+        resolved_package = alias_index.get(package_name)
+        if resolved_package is not None:
+            print(f"{Fore.BLUE}Resolving alias '{Fore.YELLOW}{package_name}{Fore.BLUE}' to '{Fore.CYAN}{resolved_package}{Fore.BLUE}'")
+            package_name = resolved_package
             
         if package_name == "com.mralfiem591.paxd":
             print(f"{Fore.RED}Cannot uninstall PaxD itself using PaxD. Please uninstall manually.")
@@ -1590,10 +1940,11 @@ class PaxD:
         
         # Check if package is actually installed
         package_install_path = os.path.join(local_app_data, package_name)
+        bat_file_path = os.path.join(BIN_DIR, f"{package_data.get('install', {}).get('alias', package_name)}.bat")
         if not os.path.exists(package_install_path):
-            if os.path.exists(os.path.join(os.path.dirname(os.path.abspath(__file__)), "bin", f"{package_data.get('install', {}).get('alias', package_name)}.bat")):
+            if os.path.exists(bat_file_path):
                 print(f"{Fore.YELLOW}Package '{Fore.CYAN}{package_name}{Fore.YELLOW}' is already not installed, but found leftover files. Cleaning up...")
-                os.remove(os.path.join(os.path.dirname(os.path.abspath(__file__)), "bin", f"{package_data.get('install', {}).get('alias', package_name)}.bat"))
+                os.remove(bat_file_path)
             print(f"{Fore.YELLOW}Package '{Fore.CYAN}{package_name}{Fore.YELLOW}' is already not installed.")
             return
         
@@ -1601,7 +1952,6 @@ class PaxD:
         print(f"{Fore.CYAN}Retrieved package metadata for '{pkg_name_friendly}'")
         
         # Remove the bat file from bin, if it exists
-        bat_file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bin", f"{package_data.get('install', {}).get('alias', package_name)}.bat")
         if os.path.exists(bat_file_path):
             os.remove(bat_file_path)
             print(f"{Fore.RED}Deleted {bat_file_path}")
@@ -1612,40 +1962,45 @@ class PaxD:
             uninstall_file_path = os.path.join(local_app_data, package_name, uninstall_file)
             if os.path.exists(uninstall_file_path) and uninstall_file.endswith(".py"):
                 print(f"{Fore.YELLOW}Running uninstall script {Fore.CYAN}{uninstall_file_path}{Fore.YELLOW}... Note that you may need to take action in another terminal window.")
-                self._verbose_print(f"Running uninstall script: {uninstall_file_path} in new cmd window")
-                subprocess.run(f"start cmd /c python {uninstall_file_path}", shell=True)
-                # Wait until the uninstall script is completed
-                input(f"{Fore.YELLOW}Press Enter once the uninstall script has completed (other window will close)...")
-                self._verbose_print("Uninstall script completed")
+                self._verbose_print(f"Running uninstall script: {uninstall_file_path} in new console window")
+                # Runs in its own console (so it can still prompt the user), and blocks until the script exits
+                result = subprocess.run([sys.executable, uninstall_file_path], creationflags=subprocess.CREATE_NEW_CONSOLE, check=False)  # type: ignore
+                self._verbose_print(f"Uninstall script completed with result code: {result.returncode}")
         
         # Clean up dependencies before deleting the package
         deps_file = os.path.join(local_app_data, package_name, ".DEPENDENCIES")
-        if os.path.exists(deps_file):
-            with open(deps_file, 'r') as f:
-                for line in f:
-                    dep = line.strip()
-                    if dep and dep.startswith("paxd:"):
-                        paxd_package = dep[len("paxd:"):]
-                        self._remove_dependency_reference(paxd_package, package_name)
+        try:
+            package_dependencies = PathLib(deps_file).read_text().split()
+        except FileNotFoundError:
+            package_dependencies = []
+        for dep in package_dependencies:
+            if dep.startswith("paxd:"):
+                paxd_package = dep[len("paxd:"):]
+                self._remove_dependency_reference(paxd_package, package_name)
                 
         # Now for the fun part - deleting the package folder from %LOCALAPPDATA%/<package_name>
         self._verbose_print(f"Deleting package folder: {package_name} at {package_install_path}")
-        package_folder = os.path.join(local_app_data, package_name)
-        if os.path.exists(package_folder):
+        package_folder = package_install_path  # Existence was already checked above
+        try:
             shutil.rmtree(package_folder, onerror=permission_handler)
-            # Check package folder is deleted
-            if not os.path.exists(package_folder):
-                print(f"{Fore.GREEN}> Successfully uninstalled '{Fore.CYAN}{package_name}{Fore.GREEN}' - deleted package folder {package_folder}")
-                self._verbose_print(f"Successfully uninstalled package: {package_name}")
-                
-                # Trigger post-uninstall extensions
-                trigger_system.execute_trigger("post_uninstall", package=package_name)
-            else:
-                print(f"{Fore.RED}Failed to delete package folder {package_folder}")
-                self._verbose_print(f"Failed to delete package folder: {package_folder}")
+        except FileNotFoundError:
+            pass  # Already removed (e.g. by the package's own uninstall script)
+        self._installed_set_cache = None
+        if self._load_depgraph().pop(package_name, None) is not None:
+            self._save_depgraph()
+        # Check package folder is deleted
+        if not os.path.exists(package_folder):
+            print(f"{Fore.GREEN}> Successfully uninstalled '{Fore.CYAN}{package_name}{Fore.GREEN}' - deleted package folder {package_folder}")
+            self._verbose_print(f"Successfully uninstalled package: {package_name}")
+
+            # Trigger post-uninstall extensions
+            trigger_system.execute_trigger("post_uninstall", package=package_name)
+        else:
+            print(f"{Fore.RED}Failed to delete package folder {package_folder}")
+            self._verbose_print(f"Failed to delete package folder: {package_folder}")
 
     def update(self, package_name=None, force=False, skip_checksum=False): # type: ignore
-        """Update a package to the latest version."""
+        """Update a package to the latest version. Returns True if the installed version changed."""
         self._verbose_timing_start(f"update {package_name}")
         self._verbose_print(f"Updating package: {package_name} (force={force})")
         
@@ -1656,7 +2011,7 @@ class PaxD:
             self._verbose_print("No package name provided for update")
             self._verbose_timing_end(f"update {package_name}")
             print(f"{Fore.RED}No package specified for update.")
-            return
+            return False
             
         print(f"{Fore.BLUE}Updating {Fore.CYAN}{package_name}{Fore.BLUE}...")
         
@@ -1665,7 +2020,7 @@ class PaxD:
         self._verbose_print("Reading and resolving repository URL for update")
         repo_url = self._read_repository_url()
         repo_url = self._resolve_repository_url(repo_url)
-        local_app_data = os.path.join(os.path.expandvars(r"%LOCALAPPDATA%"), "PaxD")
+        local_app_data = self.local_app_data
         self._verbose_print(f"Local app data directory: {local_app_data}")
         
         # Check if this is a metapackage
@@ -1681,7 +2036,7 @@ class PaxD:
                 self._verbose_timing_end(f"update {package_name}")
                 print(f"{Fore.RED}X {e}")
                 print(f"{Fore.YELLOW}Cannot update a metapackage that doesn't exist in the repository.")
-                return
+                return False
             
             print(f"{Fore.GREEN}Metapackage contains {len(package_list)} packages:")
             for pkg in package_list:
@@ -1691,11 +2046,13 @@ class PaxD:
             # Update each package in the metapackage
             updated_packages = []
             failed_packages = []
+            any_changed = False
             
             for pkg in package_list:
                 try:
                     print(f"{Fore.BLUE}Updating package {Fore.YELLOW}{pkg}{Fore.BLUE} from metapackage...")
-                    self.update(pkg, force=force, skip_checksum=skip_checksum)
+                    if self.update(pkg, force=force, skip_checksum=skip_checksum):
+                        any_changed = True
                     updated_packages.append(pkg)
                 except Exception as e:
                     self._verbose_print(f"Failed to update package {pkg} from metapackage: {e}")
@@ -1712,28 +2069,23 @@ class PaxD:
             if failed_packages:
                 print(f"{Fore.RED}Failed to update: {Fore.YELLOW}{', '.join(failed_packages)}")
                 
-            return
+            return any_changed
 
         # GET {repo_url}/resolution to resolve aliases
-        resolution_url = f"{repo_url}/resolution"
-        resolution_response = requests.get(resolution_url, headers=self.headers, allow_redirects=True)  # type: ignore
-        self._verbose_print(f"GET {resolution_url}: {resolution_response.status_code}")
-        resolution_response.raise_for_status()
-        resolution_data = parse_jsonc(resolution_response.text)
+        _, alias_index = self._fetch_resolution(repo_url)
         
         # Check if package name needs to be resolved from alias to actual package name
         original_package_name = package_name
-        for actual_package, aliases in resolution_data.items():
-            if package_name in aliases:
-                print(f"{Fore.BLUE}Resolving alias '{Fore.YELLOW}{package_name}{Fore.BLUE}' to '{Fore.CYAN}{actual_package}{Fore.BLUE}'")
-                package_name = actual_package
-                break
+        actual_package = alias_index.get(package_name)
+        if actual_package is not None:
+            print(f"{Fore.BLUE}Resolving alias '{Fore.YELLOW}{package_name}{Fore.BLUE}' to '{Fore.CYAN}{actual_package}{Fore.BLUE}'")
+            package_name = actual_package
         
         # Check if package is currently installed
         package_install_path = os.path.join(local_app_data, package_name)
         if not os.path.exists(package_install_path):
             print(f"{Fore.RED}Package '{Fore.CYAN}{original_package_name}{Fore.RED}' is not installed. Use '{Fore.GREEN}paxd install {original_package_name}{Fore.RED}' to install it.")
-            return
+            return False
         
         # Special handling for updating PaxD itself
         if package_name == "com.mralfiem591.paxd":
@@ -1745,9 +2097,18 @@ class PaxD:
         # Get current installed version (if available)
         current_version = None
         version_file = os.path.join(package_install_path, ".VERSION")
-        if os.path.exists(version_file):
-            with open(version_file, 'r') as f:
-                current_version = f.read().strip()
+        try:
+            current_version = PathLib(version_file).read_text().strip()
+        except FileNotFoundError:
+            pass
+        
+        # Fast path: if the metadata this version was installed from is unchanged (304), there is nothing to do
+        if not force and current_version is not None and self._metadata_unchanged(package_name, package_install_path):
+            self._verbose_print(f"Metadata for {package_name} not modified, skipping update")
+            print(f"{Fore.GREEN}Package '{package_name}' is already up to date ({current_version}).")
+            trigger_system.execute_trigger("post_update", package=package_name, version=current_version, files=[])
+            self._verbose_timing_end(f"update {package_name}")
+            return False
         
         # Fetch latest package metadata
         self._verbose_print(f"Fetching latest package metadata for: {package_name}")
@@ -1756,7 +2117,7 @@ class PaxD:
         except PackageNotFoundError:
             print(f"{Fore.RED}X Package '{Fore.YELLOW}{package_name}{Fore.RED}' was not found in the repository.")
             print(f"{Fore.YELLOW}Cannot update a package that doesn't exist in the repository.")
-            return
+            return False
         self._verbose_print(f"Successfully fetched metadata from {source_file}")
         if source_file == "paxd.yaml":
             print(f"{Fore.GREEN}Using YAML package configuration")
@@ -1770,13 +2131,17 @@ class PaxD:
         
         # Check if update is needed
         if current_version == latest_version and not force:
+            self._save_metadata_etag(package_name, package_install_path, current_version)
             print(f"{Fore.GREEN}Package '{pkg_name_friendly}' is already up to date.")
-            return
+            trigger_system.execute_trigger("post_update", package=package_name, version=current_version, files=[])
+            self._verbose_timing_end(f"update {package_name}")
+            return False
         
         print(f"{Fore.BLUE}Updating '{pkg_name_friendly}' from {Fore.RED}{current_version or 'Unknown'}{Fore.BLUE} to {Fore.GREEN}{latest_version}")
         
         # Handle dependencies (both new and existing)
         current_dependencies = set()
+        external_installs = []  # (dep, argv) for winget/choco/npm - run in parallel once the loop is done
         for dep in package_data.get("install", {}).get("depend", []):
             current_dependencies.add(dep)
             try:
@@ -1791,17 +2156,17 @@ class PaxD:
                 elif dep.startswith("winget:"):
                     winget_package = dep[len("winget:"):]
                     print(f"Installing/updating Windows package '{winget_package}' via winget")
-                    os.system(f"winget install {winget_package}")
+                    external_installs.append((dep, ["winget", "install", winget_package, "--disable-interactivity"]))
                 # Dependency begins with "choco:": use choco to install
                 elif dep.startswith("choco:"):
                     choco_package = dep[len("choco:"):]
                     print(f"Installing/updating Chocolatey package '{choco_package}' via choco")
-                    os.system(f"choco upgrade {choco_package}")
+                    external_installs.append((dep, ["choco", "upgrade", choco_package]))
                 # Dependency begins with "npm:": use npm to install
                 elif dep.startswith("npm:"):
                     npm_package = dep[len("npm:"):]
                     print(f"Installing/updating Node.js package '{npm_package}' via npm")
-                    os.system(f"npm install {npm_package}")
+                    external_installs.append((dep, ["npm", "install", npm_package]))
                 # Dependency begins with "paxd:": check if installed, then install or update
                 elif dep.startswith("paxd:"):
                     paxd_package = dep[len("paxd:"):]
@@ -1822,6 +2187,10 @@ class PaxD:
                     print(f"Unknown dependency type for '{dep}'")
             except Exception as e:
                 print(f"Warning: Failed to handle dependency '{dep}': {e}")
+        
+        for dep, result, error in self._run_external_installs(external_installs):
+            if error is not None:
+                print(f"Warning: Failed to handle dependency '{dep}': {error}")
                 
         if PIP_PACKAGES:
             # Install all at once
@@ -1848,7 +2217,7 @@ class PaxD:
                 continue
                 
             file_url = f"{repo_url}/packages/{package_name}/src/{file}"
-            file_response = requests.get(file_url, headers=self.headers, allow_redirects=True)  # type: ignore
+            file_response = self._session.get(file_url, allow_redirects=True)  # type: ignore
             self._verbose_print(f"GET {file_url}: {file_response.status_code}")
             file_response.raise_for_status()
             file_data = file_response.content
@@ -1866,10 +2235,6 @@ class PaxD:
             with open(install_path, 'wb') as f:
                 f.write(file_data)
                 
-            # Small delay to ensure file write is completely flushed
-            import time
-            time.sleep(0.1)
-                
             updated_files.append(file)
             
             # Verify checksum if provided using retry mechanism
@@ -1930,26 +2295,29 @@ class PaxD:
         
         # Update the version file
         version_file = os.path.join(package_install_path, ".VERSION")
-        with open(version_file, 'w') as f:
-            f.write(latest_version)
-        
+        _atomic_write(version_file, latest_version)
+        self._save_metadata_etag(package_name, package_install_path, latest_version)
+        if package_name == "com.mralfiem591.paxd":
+            # The cached "latest PaxD version" was checked against the old version - don't let it suggest a downgrade
+            try:
+                os.remove(os.path.join(package_install_path, ".LATEST_VERSION"))
+            except FileNotFoundError:
+                pass
+
         # Handle updaterun flag
         if package_data.get("install", {}).get("updaterun"):
             updaterun_path = os.path.join(local_app_data, package_name, ".UPDATERUN")
-            with open(updaterun_path, 'w') as f:
-                f.write("This file indicates that the package has been updated and may need special handling.")
+            _atomic_write(updaterun_path, "This file indicates that the package has been updated and may need special handling.")
             print(f"Created .UPDATERUN file at {updaterun_path}")
         
         # Update batch file if mainfile exists (in case alias or mainfile changed)
         mainfile = package_data.get("install", {}).get("mainfile")
         if mainfile:
-            alias = package_data.get("install", {}).get("alias", mainfile.split(".")[0])
-            bat_file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bin", f"{alias}.bat")
+            alias = package_data.get("install", {}).get("alias", mainfile.partition(".")[0])
+            bat_file_path = os.path.join(BIN_DIR, f"{alias}.bat")
             
             # Update the batch file content
-            with open(bat_file_path, 'w') as f:
-                f.write(f"@echo off\n")
-                f.write(f'"{sys.executable}" "{os.path.join(local_app_data, "com.mralfiem591.paxd", "run_pkg.py")}" "{os.path.join(local_app_data, package_name, mainfile)}" %*\n')
+            _atomic_write(bat_file_path, f'@echo off\n"{sys.executable}" "{RUN_PKG_PATH}" "{os.path.join(local_app_data, package_name, mainfile)}" %*\n')
             print(f"Updated batch file at {bat_file_path}")
         
         print(f"{Fore.GREEN}> Successfully updated '{pkg_name_friendly}' to version {Fore.CYAN}{latest_version}{Style.RESET_ALL}")
@@ -1960,6 +2328,7 @@ class PaxD:
         
         # Trigger post-update extensions
         trigger_system.execute_trigger("post_update", package=package_name, version=latest_version, files=updated_files)
+        return current_version != latest_version
             
     def list_installed(self):
         """List all installed packages with their versions."""
@@ -1967,25 +2336,26 @@ class PaxD:
         # Trigger: listall.start
         trigger_system.execute_trigger("listall.start")
         
-        local_app_data = os.path.join(os.path.expandvars(r"%LOCALAPPDATA%"), "PaxD")
+        local_app_data = self.local_app_data
         if not os.path.exists(local_app_data):
             print(f"{Fore.YELLOW}No packages installed.")
             return
         
         packages = []
-        for item in os.listdir(local_app_data):
-            if item == ".metapackages" or item == "extensions":
-                continue
-            package_path = os.path.join(local_app_data, item)
-            if os.path.isdir(package_path):
-                version_file = os.path.join(package_path, ".VERSION")
-                version = "Unknown"
-                if os.path.exists(version_file):
-                    with open(version_file, 'r') as f:
-                        version = f.read().strip()
-                
-                user_installed = os.path.exists(os.path.join(package_path, ".USER_INSTALLED"))
-                packages.append((item, version, user_installed))
+        with os.scandir(local_app_data) as entries:
+            for entry in entries:
+                item = entry.name
+                if item == ".metapackages" or item == ".metacache" or item == "extensions":
+                    continue
+                if entry.is_dir():
+                    version = "Unknown"
+                    try:
+                        version = PathLib(entry.path, ".VERSION").read_text().strip()
+                    except FileNotFoundError:
+                        pass
+                    
+                    user_installed = os.path.exists(os.path.join(entry.path, ".USER_INSTALLED"))
+                    packages.append((item, version, user_installed))
         
         if not packages:
             print(f"{Fore.YELLOW}No packages installed.")
@@ -1999,11 +2369,20 @@ class PaxD:
         # Trigger: listall.end
         trigger_system.execute_trigger("listall.end", packages=packages)
 
+    def _installed_set(self):
+        """Snapshot the PaxD install directory with a single scan, so repeated is_installed calls don't each stat the disk."""
+        if self._installed_set_cache is None:
+            local_app_data = self.local_app_data
+            try:
+                # Windows paths are case-insensitive, so compare lowercased names
+                self._installed_set_cache = frozenset(entry.name.lower() for entry in os.scandir(local_app_data))
+            except FileNotFoundError:
+                self._installed_set_cache = frozenset()
+        return self._installed_set_cache
+
     def is_installed(self, package_name):
         """Check if a package is installed."""
-        local_app_data = os.path.join(os.path.expandvars(r"%LOCALAPPDATA%"), "PaxD")
-        package_install_path = os.path.join(local_app_data, package_name)
-        return os.path.exists(package_install_path)
+        return package_name.lower() in self._installed_set()
 
     def info(self, package_name, fullsize=False):
         """Display detailed information about a package."""
@@ -2017,27 +2396,17 @@ class PaxD:
         self._verbose_print("Reading and resolving repository URL for info")
         repo_url = self._read_repository_url()
         repo_url = self._resolve_repository_url(repo_url)
-        local_app_data = os.path.join(os.path.expandvars(r"%LOCALAPPDATA%"), "PaxD")
+        local_app_data = self.local_app_data
         self._verbose_print(f"Local app data directory: {local_app_data}")
         
         # GET {repo_url}/resolution to resolve aliases
-        resolution_url = f"{repo_url}/resolution"
-        self._verbose_print(f"Fetching resolution data from: {resolution_url}")
-        resolution_response = requests.get(resolution_url, headers=self.headers, allow_redirects=True)  # type: ignore
-        self._verbose_print(f"GET {resolution_url}: {resolution_response.status_code}")
-        self._verbose_print(f"Resolution response status: {resolution_response.status_code}")
-        resolution_response.raise_for_status()
-        resolution_data = parse_jsonc(resolution_response.text)
+        resolution_data, alias_index = self._fetch_resolution(repo_url)
         self._verbose_print(f"Resolution data contains {len(resolution_data)} packages")
         
         # Check if package name needs to be resolved from alias to actual package name
         original_package_name = package_name
-        resolved_from_alias = False
-        for actual_package, aliases in resolution_data.items():
-            if package_name in aliases:
-                package_name = actual_package
-                resolved_from_alias = True
-                break
+        resolved_from_alias = package_name in alias_index
+        package_name = alias_index.get(package_name, package_name)
         
         # Fetch package metadata (try both paxd and paxd.yaml)
         self._verbose_print(f"Fetching package metadata for info: {package_name}")
@@ -2060,70 +2429,71 @@ class PaxD:
         if is_installed:
             # Get installed version
             version_file = os.path.join(package_install_path, ".VERSION")
-            if os.path.exists(version_file):
-                with open(version_file, 'r') as f:
-                    installed_version = f.read().strip()
+            try:
+                installed_version = PathLib(version_file).read_text().strip()
+            except FileNotFoundError:
+                pass
             
             # Check if user-installed
             user_installed_file = os.path.join(package_install_path, ".USER_INSTALLED")
             is_user_installed = os.path.exists(user_installed_file)
         
-        # Display package information
-        print(f"{Fore.BLUE}{'=' * 60}")
+        # Display package information - collected into one block and written with a single print
+        info_lines = [_SEP_BLUE]
         pkg_info = package_data.get('pkg_info', {})
         
         # Package name and version
         pkg_name = pkg_info.get('pkg_name', package_name)
         pkg_version = pkg_info.get('pkg_version', 'Unknown')
-        print(f"{Fore.CYAN}Package: {Fore.GREEN}{pkg_name}")
-        print(f"{Fore.WHITE}ID: {Fore.YELLOW}{package_name}")
+        info_lines.append(f"{Fore.CYAN}Package: {Fore.GREEN}{pkg_name}")
+        info_lines.append(f"{Fore.WHITE}ID: {Fore.YELLOW}{package_name}")
         
         if resolved_from_alias:
-            print(f"{Fore.YELLOW}Alias: {Fore.MAGENTA}{original_package_name}")
+            info_lines.append(f"{Fore.YELLOW}Alias: {Fore.MAGENTA}{original_package_name}")
         
-        print(f"{Fore.BLUE}Version: {Fore.WHITE}{pkg_version}")
+        info_lines.append(f"{Fore.BLUE}Version: {Fore.WHITE}{pkg_version}")
         
         # Author and description
         if 'pkg_author' in pkg_info:
-            print(f"{Fore.MAGENTA}Author: {Style.RESET_ALL}{pkg_info['pkg_author']}")
+            info_lines.append(f"{Fore.MAGENTA}Author: {Style.RESET_ALL}{pkg_info['pkg_author']}")
         
         if 'pkg_description' in pkg_info:
-            print(f"{Fore.WHITE}Description: {Style.RESET_ALL}{pkg_info['pkg_description']}")
+            info_lines.append(f"{Fore.WHITE}Description: {Style.RESET_ALL}{pkg_info['pkg_description']}")
         
         # Installation status
-        print(f"\n{Fore.YELLOW}Installation Status:")
+        info_lines.append(f"\n{Fore.YELLOW}Installation Status:")
         if is_installed:
-            print(f"  {Fore.GREEN}[+] Installed (version {Fore.CYAN}{installed_version or 'Unknown'}{Fore.GREEN})")
+            info_lines.append(f"  {Fore.GREEN}[+] Installed (version {Fore.CYAN}{installed_version or 'Unknown'}{Fore.GREEN})")
             if is_user_installed:
-                print(f"  {Fore.GREEN}[+] User-installed (won't be auto-removed)")
+                info_lines.append(f"  {Fore.GREEN}[+] User-installed (won't be auto-removed)")
             else:
-                print(f"  {Fore.YELLOW}[!] Dependency (may be auto-removed)")
+                info_lines.append(f"  {Fore.YELLOW}[!] Dependency (may be auto-removed)")
             
             # Check if update is available
             if installed_version and installed_version != pkg_version:
-                print(f"  {Fore.BLUE}[*] Update available: {Fore.RED}{installed_version}{Fore.BLUE} -> {Fore.GREEN}{pkg_version}")
+                info_lines.append(f"  {Fore.BLUE}[*] Update available: {Fore.RED}{installed_version}{Fore.BLUE} -> {Fore.GREEN}{pkg_version}")
             elif installed_version == pkg_version:
-                print(f"  {Fore.GREEN}[+] Up to date")
+                info_lines.append(f"  {Fore.GREEN}[+] Up to date")
         else:
-            print(f"  {Fore.RED}[-] Not installed")
+            info_lines.append(f"  {Fore.RED}[-] Not installed")
             
         if is_installed and not fullsize:
             try:
                 package_size = sum(os.path.getsize(os.path.join(dirpath, filename))
                                 for dirpath, dirnames, filenames in os.walk(package_install_path)
                                 for filename in filenames)
-                print(f"  {Fore.BLUE}Size: {Fore.WHITE}{package_size / 1024:.1f} KB")
+                info_lines.append(f"  {Fore.BLUE}Size: {Fore.WHITE}{package_size / 1024:.1f} KB")
             except:
                 pass
         elif is_installed and fullsize:
             try:
                 for file in os.walk(package_install_path):
                     for filename in file[2]:
-                        if filename in [".VERSION", ".USER_INSTALLED", ".DEPENDENCIES", ".FIRSTRUN", ".UPDATERUN"]:
+                        if filename in [".VERSION", ".USER_INSTALLED", ".DEPENDENCIES", ".FIRSTRUN", ".UPDATERUN", ".ETAG", ".LATEST_VERSION"]:
                             continue
                         filepath = os.path.join(file[0], filename)
                         filesize = os.path.getsize(filepath)
-                        print(f"  {Fore.WHITE}{os.path.relpath(filepath, package_install_path)}: {filesize / 1024:.1f} KB")
+                        info_lines.append(f"  {Fore.WHITE}{os.path.relpath(filepath, package_install_path)}: {filesize / 1024:.1f} KB")
             except:
                 pass
         
@@ -2131,36 +2501,36 @@ class PaxD:
         install_info = package_data.get('install', {})
         dependencies = install_info.get('depend', [])
         if dependencies:
-            print(f"\n{Fore.YELLOW}Dependencies:")
+            info_lines.append(f"\n{Fore.YELLOW}Dependencies:")
             for dep in dependencies:
                 if dep.startswith("paxd:"):
                     paxd_dep = dep[len("paxd:"):]
-                    dep_path = os.path.join(local_app_data, paxd_dep)
-                    status = f"{Fore.GREEN}[+] installed" if os.path.exists(dep_path) else f"{Fore.RED}[-] not installed"
-                    print(f"  - {Fore.CYAN}{paxd_dep}{Style.RESET_ALL} (PaxD) - {status}")
+                    status = f"{Fore.GREEN}[+] installed" if self.is_installed(paxd_dep) else f"{Fore.RED}[-] not installed"
+                    info_lines.append(f"  - {Fore.CYAN}{paxd_dep}{Style.RESET_ALL} (PaxD) - {status}")
                 else:
-                    dep_type = dep.split(":")[0] if ":" in dep else "unknown"
-                    dep_name = dep.split(":", 1)[1] if ":" in dep else dep
-                    print(f"  - {Fore.WHITE}{dep_name}{Style.RESET_ALL} ({Fore.MAGENTA}{dep_type}{Style.RESET_ALL})")
+                    dep_type, sep, dep_name = dep.partition(":")
+                    if not sep:
+                        dep_type, dep_name = "unknown", dep
+                    info_lines.append(f"  - {Fore.WHITE}{dep_name}{Style.RESET_ALL} ({Fore.MAGENTA}{dep_type}{Style.RESET_ALL})")
         
         # Files included
         included_files = install_info.get('include', [])
         if included_files:
-            print(f"\n{Fore.BLUE}Included Files:")
+            info_lines.append(f"\n{Fore.BLUE}Included Files:")
             excluded_files = install_info.get('update-ex', [])
             for file in included_files:
                 if file in excluded_files:
-                    print(f"  - {Fore.WHITE}{file}{Style.RESET_ALL} {Fore.YELLOW}(excluded from updates)")
+                    info_lines.append(f"  - {Fore.WHITE}{file}{Style.RESET_ALL} {Fore.YELLOW}(excluded from updates)")
                 else:
-                    print(f"  - {Fore.WHITE}{file}")
+                    info_lines.append(f"  - {Fore.WHITE}{file}")
         
         # Main executable
         mainfile = install_info.get('mainfile')
         if mainfile:
-            alias = install_info.get('alias', mainfile.split(".")[0])
-            print(f"\n{Fore.GREEN}Executable:")
-            print(f"  {Fore.WHITE}Main file: {Fore.CYAN}{mainfile}")
-            print(f"  {Fore.WHITE}Command: {Fore.GREEN}{alias}")
+            alias = install_info.get('alias', mainfile.partition(".")[0])
+            info_lines.append(f"\n{Fore.GREEN}Executable:")
+            info_lines.append(f"  {Fore.WHITE}Main file: {Fore.CYAN}{mainfile}")
+            info_lines.append(f"  {Fore.WHITE}Command: {Fore.GREEN}{alias}")
         
         # Special flags
         special_flags = []
@@ -2170,17 +2540,19 @@ class PaxD:
             special_flags.append("Creates .UPDATERUN marker on updates")
         
         if special_flags:
-            print(f"\nSpecial Features:")
+            info_lines.append(f"\nSpecial Features:")
             for flag in special_flags:
-                print(f"  - {flag}")
+                info_lines.append(f"  - {flag}")
         
         # Uninstall info
         uninstall_info = package_data.get('uninstall', {})
         if uninstall_info.get('file'):
-            print(f"\nUninstall:")
-            print(f"  Custom uninstall script: {uninstall_info['file']}")
+            info_lines.append(f"\nUninstall:")
+            info_lines.append(f"  Custom uninstall script: {uninstall_info['file']}")
         
-        print("=" * 60)
+        info_lines.append("=" * 60)
+        # colorama's autoreset only resets at the end of a write, so reset after every line
+        print("\n".join(line + Style.RESET_ALL for line in info_lines))
         self._verbose_timing_end(f"info {package_name}")
             
     def show_repo_info(self):
@@ -2189,24 +2561,22 @@ class PaxD:
             repo_url = self._read_repository_url()
             repo_url = self._resolve_repository_url(repo_url)
             repo_info_url = f"{repo_url}/paxd"
-            repo_response = requests.get(repo_info_url, headers=self.headers, allow_redirects=True)  # type: ignore
-            self._verbose_print(f"GET {repo_info_url}: {repo_response.status_code}")
-            repo_response.raise_for_status()
-            repo_data = parse_jsonc(repo_response.text)
-            
-            print(f"{Fore.BLUE}{'=' * 60}")
-            print(f"{Fore.CYAN}Repository Information:")
-            print(f"{Fore.YELLOW}Name:{Style.RESET_ALL} {repo_data.get('repo_info', {}).get('repo_name', 'Unknown')}")
-            print(f"{Fore.MAGENTA}Author:{Style.RESET_ALL} {repo_data.get('repo_info', {}).get('repo_author', 'Unknown')}")
-            print(f"{Fore.WHITE}Description:{Style.RESET_ALL} {repo_data.get('repo_info', {}).get('repo_description', 'No description provided.')}")
-            print(f"{Fore.GREEN}Website:{Style.RESET_ALL} {repo_data.get('repo_info', {}).get('repo_site', 'No website provided.')}")
-                
-            print(f"{Fore.BLUE}URL:{Style.RESET_ALL} {repo_url}")
-            print(f"{Fore.BLUE}{'=' * 60}")
+            repo_data = self._cached_get_parsed(repo_info_url, parse_jsonc)
+            
+            print(_SEP_BLUE)
+            repo_info = repo_data.get('repo_info', {})
+            print(_REPO_INFO_FMT.format(
+                name=repo_info.get('repo_name', 'Unknown'),
+                author=repo_info.get('repo_author', 'Unknown'),
+                description=repo_info.get('repo_description', 'No description provided.'),
+                site=repo_info.get('repo_site', 'No website provided.'),
+                url=repo_url,
+            ))
+            print(_SEP_BLUE)
             for key, value in repo_data.get('credit', {}).items():
-                print(f"{Fore.GREEN}- {key.title()}: {value}")
+                print(_REPO_CREDIT_FMT.format(key.title(), value))
             if repo_data.get('credit', {}):
-                print(f"{Fore.BLUE}{'=' * 60}")
+                print(_SEP_BLUE)
 
             if repo_data.get('repo_info', {}).get('repo_logo'):
                 if self.is_installed("com.mralfiem591.paxd-imageview"):
@@ -2234,11 +2604,7 @@ class PaxD:
         repo_url = self._read_repository_url()
         repo_url = self._resolve_repository_url(repo_url)
         
-        print(f"{Fore.CYAN}PaxD (Package xpress Delivery) - Package Manager for Developers")
-        print(f"{Fore.WHITE}Developed by mralfiem591")
-        print(f"{Fore.LIGHTBLUE_EX}Powered by Python")
-        print(f"{Fore.LIGHTMAGENTA_EX}Inspired by package managers like pip, npm, winget, and apt-get")
-        print(f"{Fore.YELLOW}View repository credits and info via the '{Fore.LIGHTYELLOW_EX}paxd repo-info{Fore.YELLOW}' command")
+        print(_CREDIT_TEXT)
         if self.is_installed("com.mralfiem591.paxd-imageview"):
             subprocess.Popen(f"start cmd /c paxd-imageview --sleep 5 {repo_url}/packages/com.mralfiem591.paxd/src/asset/logo.png", shell=True)
     
@@ -2262,165 +2628,192 @@ class PaxD:
             repo_url = self._resolve_repository_url(repo_url)
             
             print(f"{Fore.CYAN}Searching for '{Fore.YELLOW}{search_term}{Fore.CYAN}'...")
-            print(f"{Fore.BLUE}{'=' * 60}")
+            print(_SEP_BLUE)
             
             found_packages = []
-            search_term_lower = search_term.lower()
-            
-            # Search for metapackages first
-            self._verbose_print("Searching for metapackages")
+            # Compile the term once; every field check below reuses the same case-insensitive matcher
+            search_pattern = re.compile(re.escape(search_term), re.IGNORECASE)
+            
+            def match_fields(package_name, display_name, description, author, alias, aliases):
+                # Keyed by (field, value): dict keys dedupe repeated aliases and keep first-seen order
+                matches = {}
+                if search_pattern.search(package_name):
+                    matches[("package name", package_name)] = None
+                if search_pattern.search(display_name):
+                    matches[("display name", display_name)] = None
+                for alias_name in ([alias] if alias else []) + list(aliases):
+                    if search_pattern.search(alias_name):
+                        matches[("alias", alias_name)] = None
+                if search_pattern.search(description):
+                    matches[("description", "")] = None
+                if search_pattern.search(author):
+                    matches[("author", author)] = None
+                return [f"{field}: {value}" if value else field for field, value in matches]
             
-            try:
-                # Try to find metapackages by searching for .meta files
-                packages_url = f"{repo_url}/packages"
-                self._verbose_print(f"Looking for metapackages at: {packages_url}")
-                
-                # Get list of items in packages directory (not perfect but works with GitHub)
-                # This is a simple heuristic - try common metapackage names
-                potential_metapackages = [
-                    "paxd-development.meta",
-                    "paxd-essentials.meta", 
-                    "web-dev.meta",
-                    "python-dev.meta",
-                    "utilities.meta",
-                    "games.meta"
-                ]
-                
-                # Also try the search term as a metapackage
-                if not search_term.endswith('.meta'):
-                    potential_metapackages.append(f"{search_term}.meta")
-                    potential_metapackages.append(f"{search_term}-dev.meta")
-                    potential_metapackages.append(f"{search_term}-tools.meta")
-                
-                for meta_name in potential_metapackages:
-                    try:
-                        meta_base = meta_name[:-5] if meta_name.endswith('.meta') else meta_name
-                        if search_term_lower in meta_base.lower():
-                            # Try to fetch this metapackage
-                            meta_url = f"{repo_url}/packages/{meta_name}"
-                            meta_response = requests.get(meta_url, headers=self.headers, allow_redirects=True)  # type: ignore
-                            
-                            if meta_response.status_code == 200:
-                                self._verbose_print(f"Found metapackage: {meta_name}")
-                                # Parse the metapackage content
-                                package_list = [line.strip() for line in meta_response.text.strip().split('\n') if line.strip()]
-                                
-                                found_packages.append({
-                                    'package_name': meta_name,
-                                    'display_name': f"Metapackage: {meta_base}",
-                                    'description': f"Collection of {len(package_list)} packages: {', '.join(package_list[:3])}{'...' if len(package_list) > 3 else ''}",
-                                    'author': 'Repository Maintainer',
-                                    'version': 'metapackage',
-                                    'alias': '',
-                                    'aliases': [],
-                                    'matches': [f"metapackage name: {meta_base}"],
-                                    'is_installed': False  # Metapackages don't have installation state
-                                })
-                    except Exception as e:
-                        self._verbose_print(f"Error checking metapackage {meta_name}: {e}")
-                        continue
-                        
-            except Exception as e:
-                self._verbose_print(f"Error searching for metapackages: {e}")
-
             # Try to use searchindex.csv for faster searching
             searchindex_url = f"{repo_url}/searchindex.csv"
             self._verbose_print(f"Attempting to fetch search index from: {searchindex_url}")
             
             try:
-                searchindex_response = requests.get(searchindex_url, headers=self.headers, allow_redirects=True)  # type: ignore
-                self._verbose_print(f"GET {searchindex_url}: {searchindex_response.status_code}")
+                import csv
+                from io import StringIO
+                # Raises HTTPError (handled below) if the repository has no search index
+                searchindex_rows = self._cached_get_parsed(searchindex_url, lambda text: list(csv.reader(StringIO(text))))
+                
+                self._verbose_print("Search index found, using optimized search")
+                
+                # Resolve column positions once from the header instead of building a dict per row
+                header = searchindex_rows[0]
+                idx_pkg = header.index('package_id')
+                idx_name = header.index('package_name')
+                idx_desc = header.index('description')
+                idx_author = header.index('author')
+                idx_version = header.index('version')
+                idx_alias = header.index('alias')
+                idx_aliases = header.index('aliases')
+                idx_meta = header.index('is_metapackage') if 'is_metapackage' in header else None
+                row_width = len(header)
                 
-                if searchindex_response.status_code == 200:
-                    self._verbose_print("Search index found, using optimized search")
-                    # Parse CSV data
-                    import csv
-                    from io import StringIO
+                # Search through the index
+                for row in searchindex_rows[1:]:
+                    if not row:
+                        continue  # Blank line (DictReader skipped these too)
+                    if len(row) < row_width:
+                        # Short row: missing cells count as empty, like DictReader's fill-in, instead of dropping the package
+                        row = row + [''] * (row_width - len(row))
+                    # Raw cell values are matched against; the display defaults are only applied to the result below,
+                    # so that e.g. searching "unknown" doesn't match every package with an empty author
+                    package_name = row[idx_pkg]
+                    display_name = row[idx_name]
+                    description = row[idx_desc]
+                    author = row[idx_author]
+                    version = row[idx_version]
+                    alias = row[idx_alias]
+                    # Aliases are stored as pipe-separated values
+                    aliases_str = row[idx_aliases]
                     
-                    csv_data = StringIO(searchindex_response.text)
-                    csv_reader = csv.DictReader(csv_data)
+                    # Fast reject: one scan over every searchable field before attributing matches per field
+                    haystack = '\x01'.join((package_name, display_name, description, author, alias, aliases_str))
+                    if not search_pattern.search(haystack):
+                        continue
+                    aliases = [a.strip() for a in aliases_str.split('|') if a.strip()] if aliases_str else []
                     
-                    # Search through the index
-                    for row in csv_reader:
-                        package_name = row.get('package_id', '')
-                        display_name = row.get('package_name', 'Unknown')
-                        description = row.get('description', 'No description')
-                        author = row.get('author', 'Unknown')
-                        version = row.get('version', 'Unknown')
-                        alias = row.get('alias', '')
-                        # Aliases are stored as pipe-separated values
-                        aliases_str = row.get('aliases', '')
-                        aliases = [a.strip() for a in aliases_str.split('|') if a.strip()] if aliases_str else []
-                        
-                        # Check if search term matches
-                        matches = []
-                        matched_aliases = set()
-                        
-                        # Check package name (exact and partial)
-                        if search_term_lower in package_name.lower():
-                            matches.append(f"package name: {package_name}")
-                        
-                        # Check display name
-                        if search_term_lower in display_name.lower():
-                            matches.append(f"display name: {display_name}")
-                        
-                        # Check all aliases
-                        all_aliases = set()
-                        if alias:
-                            all_aliases.add(alias)
-                        all_aliases.update(aliases)
-                        
-                        for alias_name in all_aliases:
-                            if search_term_lower in alias_name.lower():
-                                matched_aliases.add(alias_name)
-                        
-                        # Add matched aliases to results
-                        for matched_alias in sorted(matched_aliases):
-                            matches.append(f"alias: {matched_alias}")
-                        
-                        # Check description
-                        if search_term_lower in description.lower():
-                            matches.append("description")
-                        
-                        # Check author
-                        if search_term_lower in author.lower():
-                            matches.append(f"author: {author}")
-                        
-                        if matches:
-                            found_packages.append({
-                                'package_name': package_name,
-                                'display_name': display_name,
-                                'description': description,
-                                'author': author,
-                                'version': version,
-                                'alias': alias,
-                                'aliases': aliases,
-                                'matches': matches,
-                                'is_installed': self.is_installed(package_name)
-                            })
-                else:
-                    raise requests.HTTPError("Search index not found")
+                    # Check if search term matches
+                    matches = match_fields(package_name, display_name, description, author, alias, aliases)
+                    
+                    if matches:
+                        found_packages.append({
+                            'package_name': package_name,
+                            'display_name': display_name or 'Unknown',
+                            'description': description or 'No description',
+                            'author': author or 'Unknown',
+                            'version': version or 'Unknown',
+                            'alias': alias,
+                            'aliases': aliases,
+                            'matches': matches,
+                            # Metapackages don't have installation state
+                            'is_installed': False if idx_meta is not None and row[idx_meta] == 'True' else self.is_installed(package_name)
+                        })
                     
-            except (requests.HTTPError, requests.RequestException, KeyError) as index_error:
+            except (requests.HTTPError, requests.RequestException, IndexError, ValueError) as index_error:
                 # Fallback to old search method if searchindex.csv is not available
                 self._verbose_print(f"Search index not available ({index_error}), falling back to legacy search")
                 print(f"{Fore.YELLOW}Note: Using legacy search (slower). Repository maintainer should add searchindex.csv for better performance.")
                 
+                # The index lists metapackages too; without it, look them up in the metapackages directory
+                self._verbose_print("Searching for metapackages")
+                
+                try:
+                    # Try to find metapackages by searching for .meta files
+                    packages_url = f"{repo_url}/packages/metapackages"
+                    self._verbose_print(f"Looking for metapackages at: {packages_url}")
+                    
+                    # List the metapackages directory in one request where possible, otherwise fall back to guessing common names
+                    listed_metapackages = self._list_repo_packages(repo_url)
+                    potential_metapackages = listed_metapackages if listed_metapackages is not None else [
+                        "paxd-development.meta",
+                        "paxd-essentials.meta", 
+                        "web-dev.meta",
+                        "python-dev.meta",
+                        "utilities.meta",
+                        "games.meta"
+                    ]
+                    
+                    # Also try the search term as a metapackage
+                    if listed_metapackages is None and not search_term.endswith('.meta'):
+                        potential_metapackages.append(f"{search_term}.meta")
+                        potential_metapackages.append(f"{search_term}-dev.meta")
+                        potential_metapackages.append(f"{search_term}-tools.meta")
+                    
+                    def probe_metapackage(meta_name):
+                        meta_url = f"{repo_url}/packages/metapackages/{meta_name}"
+                        try:
+                            # Listed metapackages are known to exist; guessed names get a HEAD first so misses don't download an error body
+                            if listed_metapackages is None:
+                                head_response = self._session.head(meta_url, allow_redirects=True, timeout=10)  # type: ignore
+                                if head_response.status_code != 200:
+                                    return meta_name, None
+                            meta_response = self._session.get(meta_url, allow_redirects=True)  # type: ignore
+                            return meta_name, meta_response if meta_response.status_code == 200 else None
+                        except Exception as e:
+                            self._verbose_print(f"Error checking metapackage {meta_name}: {e}")
+                            return meta_name, None
+
+                    # Only probe names that could match, and probe them concurrently
+                    candidate_metapackages = [m for m in potential_metapackages if search_pattern.search(m[:-5])]
+                    from concurrent.futures import ThreadPoolExecutor
+                    with ThreadPoolExecutor(max_workers=8) as executor:
+                        probe_results = list(executor.map(probe_metapackage, candidate_metapackages))
+
+                    for meta_name, meta_response in probe_results:
+                        if meta_response is None:
+                            continue
+                        meta_base = meta_name[:-5]
+                        self._verbose_print(f"Found metapackage: {meta_name}")
+                        # Parse the metapackage content
+                        package_list = [line.strip() for line in meta_response.text.strip().split('\n') if line.strip()]
+                        
+                        found_packages.append({
+                            'package_name': meta_name,
+                            'display_name': f"Metapackage: {meta_base}",
+                            'description': f"Collection of {len(package_list)} packages: {', '.join(package_list[:3])}{'...' if len(package_list) > 3 else ''}",
+                            'author': 'Repository Maintainer',
+                            'version': 'metapackage',
+                            'alias': '',
+                            'aliases': [],
+                            'matches': [f"metapackage name: {meta_base}"],
+                            'is_installed': False  # Metapackages don't have installation state
+                        })
+                            
+                except Exception as e:
+                    self._verbose_print(f"Error searching for metapackages: {e}")
+
                 # Get resolution data for aliases
                 resolution_url = f"{repo_url}/resolution"
                 self._verbose_print(f"Fetching resolution data from: {resolution_url}")
-                resolution_response = requests.get(resolution_url, headers=self.headers, allow_redirects=True)  # type: ignore
-                self._verbose_print(f"GET {resolution_url}: {resolution_response.status_code}")
-                self._verbose_print(f"Resolution response status: {resolution_response.status_code}")
-                resolution_response.raise_for_status()
-                resolution_data = parse_jsonc(resolution_response.text)
+                resolution_data = self._cached_get_parsed(resolution_url, parse_jsonc)
                 self._verbose_print(f"Found {len(resolution_data)} packages in resolution data")
                 
+                def fetch_metadata_for_search(package_name):
+                    # Get package metadata (try both paxd and paxd.yaml)
+                    try:
+                        # Already one of 16 workers - fetch the candidate files one at a time to stay within the session's connection pool
+                        return self._fetch_package_metadata(repo_url, package_name, parallel=False)
+                    except Exception as e:
+                        self._verbose_print(f"Failed to fetch metadata for {package_name}: {e}")
+                        return None
+
+                # Fetch every package's metadata concurrently, then match locally in resolution order
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=16) as executor:
+                    fetched_metadata = list(executor.map(fetch_metadata_for_search, resolution_data))
+                
                 # Search through all packages in resolution (this gives us all available packages)
-                for package_name, aliases in resolution_data.items():
+                for (package_name, aliases), fetched in zip(resolution_data.items(), fetched_metadata):
+                    if fetched is None:
+                        continue
                     try:
-                        # Get package metadata (try both paxd and paxd.yaml)
-                        package_data, source_file = self._fetch_package_metadata(repo_url, package_name)
+                        package_data, source_file = fetched
                         self._verbose_print(f"Successfully fetched metadata from {source_file} for search")
                         pkg_info = package_data.get('pkg_info', {})
                         install_info = package_data.get('install', {})
@@ -2433,38 +2826,7 @@ class PaxD:
                         alias = install_info.get('alias', '')
                         
                         # Check if search term matches
-                        matches = []
-                        matched_aliases = set()  # Track aliases to avoid duplicates
-                        
-                        # Check package name (exact and partial)
-                        if search_term_lower in package_name.lower():
-                            matches.append(f"package name: {package_name}")
-                        
-                        # Check display name
-                        if search_term_lower in display_name.lower():
-                            matches.append(f"display name: {display_name}")
-                        
-                        # Check all aliases (both from package info and resolution) but avoid duplicates
-                        all_aliases = set()
-                        if alias:
-                            all_aliases.add(alias)
-                        all_aliases.update(aliases)
-                        
-                        for alias_name in all_aliases:
-                            if search_term_lower in alias_name.lower():
-                                matched_aliases.add(alias_name)
-                        
-                        # Add matched aliases to results
-                        for matched_alias in sorted(matched_aliases):
-                            matches.append(f"alias: {matched_alias}")
-                        
-                        # Check description
-                        if search_term_lower in description.lower():
-                            matches.append("description")
-                        
-                        # Check author
-                        if search_term_lower in author.lower():
-                            matches.append(f"author: {author}")
+                        matches = match_fields(package_name, display_name, description, author, alias, aliases)
                         
                         if matches:
                             found_packages.append({
@@ -2488,29 +2850,22 @@ class PaxD:
                 print(f"{Fore.RED}No packages found matching '{Fore.YELLOW}{search_term}{Fore.RED}'")
                 return
             
-            print(f"{Fore.GREEN}Found {Fore.WHITE}{len(found_packages)}{Fore.GREEN} package(s):")
-            print()
+            # Collect the whole result listing and write it in one go, rather than one console write per line
+            chunks = [_SEARCH_FOUND_FMT.format(len(found_packages))]
             
             for pkg in found_packages:
-                if pkg['is_installed']:
-                    status = f"{Fore.GREEN}[INSTALLED]{Style.RESET_ALL}"
-                else:
-                    status = f"{Fore.RED}[NOT INSTALLED]{Style.RESET_ALL}"
-                print(f"{status} {Fore.CYAN}{pkg['display_name']}")
-                print(f"  {Fore.WHITE}Package:{Style.RESET_ALL} {pkg['package_name']}")
+                status = _SEARCH_STATUS_INSTALLED if pkg['is_installed'] else _SEARCH_STATUS_NOT_INSTALLED
+                chunks.append(_SEARCH_ROW_HEAD_FMT.format(status=status, display_name=pkg['display_name'], package_name=pkg['package_name']))
                 if pkg['alias']:
-                    print(f"  {Fore.YELLOW}Alias:{Style.RESET_ALL} {pkg['alias']}")
+                    chunks.append(_SEARCH_ALIAS_FMT.format(pkg['alias']))
                 if pkg['aliases']:
                     other_aliases = [a for a in pkg['aliases'] if a != pkg['alias']]
                     if other_aliases:
-                        print(f"  {Fore.YELLOW}Other aliases:{Style.RESET_ALL} {', '.join(other_aliases)}")
-                print(f"  {Fore.MAGENTA}Author:{Style.RESET_ALL} {pkg['author']}")
-                print(f"  {Fore.BLUE}Version:{Style.RESET_ALL} {pkg['version']}")
-                print(f"  {Fore.WHITE}Description:{Style.RESET_ALL} {pkg['description']}")
-                print(f"  {Fore.GREEN}Matches:{Style.RESET_ALL} {', '.join(pkg['matches'])}")
-                print()
+                        chunks.append(_SEARCH_OTHER_ALIASES_FMT.format(', '.join(other_aliases)))
+                chunks.append(_SEARCH_ROW_TAIL_FMT.format(author=pkg['author'], version=pkg['version'], description=pkg['description'], matches=', '.join(pkg['matches'])))
                 
-            print(f"{Fore.CYAN}To install a package, use: {Fore.GREEN}paxd install <package_name_or_alias>")
+            chunks.append(_SEARCH_INSTALL_HINT)
+            print("\n".join(chunks))
             
             # Trigger post-search extensions
             trigger_system.execute_trigger("post_search", term=search_term, results=found_packages)
@@ -2538,9 +2893,64 @@ class PaxD:
             self._verbose_timing_end(f"search {search_term}")
             print(f"{Fore.RED}Unexpected error: {e}")
     
+    def _depgraph_file(self):
+        return os.path.join(self.local_app_data, ".depgraph.json")
+
+    def _load_depgraph(self):
+        """Load the dependency graph once per process, migrating per-package .DEPENDENCY files on first use."""
+        if self._depgraph is not None:
+            return self._depgraph
+
+        depgraph_file = self._depgraph_file()
+        try:
+            with open(depgraph_file, 'r') as f:
+                self._depgraph = {dep: set(parents) for dep, parents in json.load(f).items()}
+            return self._depgraph
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            self._verbose_print(f"Failed to read dependency graph, rebuilding it: {e}")
+
+        # No graph yet - build it from the legacy .DEPENDENCY files
+        self._depgraph = {}
+        legacy_files = []
+        local_app_data = os.path.dirname(depgraph_file)
+        try:
+            entries = list(os.scandir(local_app_data))
+        except FileNotFoundError:
+            entries = []
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            dependency_file = os.path.join(entry.path, ".DEPENDENCY")
+            try:
+                parents = set(PathLib(dependency_file).read_text().split())
+            except FileNotFoundError:
+                continue
+            if parents:
+                self._depgraph[entry.name] = parents
+            legacy_files.append(dependency_file)
+        if legacy_files:
+            self._verbose_print(f"Migrating {len(legacy_files)} .DEPENDENCY file(s) to {depgraph_file}")
+            if self._save_depgraph():
+                for dependency_file in legacy_files:
+                    os.remove(dependency_file)
+        return self._depgraph
+
+    def _save_depgraph(self) -> bool:
+        """Write the dependency graph back to disk. Returns True if it was saved."""
+        depgraph_file = self._depgraph_file()
+        try:
+            os.makedirs(os.path.dirname(depgraph_file), exist_ok=True)
+            _atomic_write(depgraph_file, json.dumps({dep: sorted(parents) for dep, parents in self._depgraph.items() if parents}, indent=2))  # type: ignore
+            return True
+        except OSError as e:
+            print(f"{Fore.YELLOW}Warning: Failed to save dependency graph: {e}")
+            return False
+
     def _mark_as_dependency(self, dependency_package: str, parent_package: str):
         """Mark a package as a dependency of another package."""
-        local_app_data = os.path.join(os.path.expandvars(r"%LOCALAPPDATA%"), "PaxD")
+        local_app_data = self.local_app_data
         dependency_path = os.path.join(local_app_data, dependency_package)
         
         if not os.path.exists(dependency_path):
@@ -2552,42 +2962,32 @@ class PaxD:
             print(f"'{dependency_package}' is user-installed, not marking as dependency")
             return
         
-        # Create or update the .DEPENDENCY file
-        dependency_file = os.path.join(dependency_path, ".DEPENDENCY")
-        dependent_packages = set()
-        
-        if os.path.exists(dependency_file):
-            with open(dependency_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        dependent_packages.add(line)
-        
-        dependent_packages.add(parent_package)
-        
-        with open(dependency_file, 'w') as f:
-            for pkg in sorted(dependent_packages):
-                f.write(f"{pkg}\n")
+        # Record the parent in the dependency graph
+        dependent_packages = self._load_depgraph().setdefault(dependency_package, set())
+        if parent_package not in dependent_packages:
+            dependent_packages.add(parent_package)
+            self._save_depgraph()
         
         print(f"Marked '{dependency_package}' as dependency of '{parent_package}'")
     
     def _cleanup_backup_files(self, backup_files: list, context: str = "update") -> int:
         """Clean up backup files and return count of files cleaned."""
         cleaned_count = 0
-        for backup_path in backup_files[:]:  # Use slice copy to avoid modification during iteration
-            if os.path.exists(backup_path):
-                try:
-                    os.remove(backup_path)
-                    cleaned_count += 1
-                    print(f"Cleaned up backup file: {os.path.basename(backup_path)} ({context})")
-                except Exception as e:
-                    print(f"Warning: Failed to remove backup file {backup_path}: {e}")
+        for backup_path in backup_files:
+            try:
+                os.unlink(backup_path)
+                cleaned_count += 1
+                print(f"Cleaned up backup file: {os.path.basename(backup_path)} ({context})")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"Warning: Failed to remove backup file {backup_path}: {e}")
         return cleaned_count
     
     def _mark_as_user_installed(self, package_name: str):
         """Mark a package as user-installed (prevents auto-removal)."""
         self._verbose_print(f"Marking package as user-installed: {package_name}")
-        local_app_data = os.path.join(os.path.expandvars(r"%LOCALAPPDATA%"), "PaxD")
+        local_app_data = self.local_app_data
         package_path = os.path.join(local_app_data, package_name)
         self._verbose_print(f"Package path: {package_path}")
         
@@ -2598,17 +2998,34 @@ class PaxD:
         # Create .USER_INSTALLED marker file
         user_installed_file = os.path.join(package_path, ".USER_INSTALLED")
         self._verbose_print(f"Creating user-installed marker: {user_installed_file}")
-        with open(user_installed_file, 'w') as f:
-            f.write(f"Package installed by user on {__import__('datetime').datetime.now().isoformat()}")
+        _atomic_write(user_installed_file, f"Package installed by user on {datetime.datetime.now().isoformat()}")
         
         # Remove from dependency tracking if it was previously a dependency
-        dependency_file = os.path.join(package_path, ".DEPENDENCY")
-        if os.path.exists(dependency_file):
+        if self._load_depgraph().pop(package_name, None):
             print(f"'{package_name}' was previously a dependency, converting to user-installed package")
-            os.remove(dependency_file)
+            self._save_depgraph()
         
         print(f"Marked '{package_name}' as user-installed")
     
+    def _download_package_file(self, repo_url, package_name, file):
+        """Download one of a package's include files and write it into the package folder, returning (install_path, file_data)."""
+        file_url = f"{repo_url}/packages/{package_name}/src/{file}"
+        self._verbose_print(f"Downloading file from: {file_url}")
+        file_response = self._session.get(file_url, allow_redirects=True)  # type: ignore
+        self._verbose_print(f"GET {file_url}: {file_response.status_code}")
+        file_response.raise_for_status()
+        file_data = file_response.content
+        self._verbose_print(f"Downloaded {len(file_data)} bytes")
+        
+        # Actually install this file to %LOCALAPPDATA%/<package_name>/{file}
+        install_path = os.path.join(self.local_app_data, package_name, file)
+        self._verbose_print(f"Installing file to: {install_path}")
+        os.makedirs(os.path.dirname(install_path), exist_ok=True)
+        with open(install_path, 'wb') as f:
+            f.write(file_data)
+        self._verbose_print(f"Successfully wrote file to disk")
+        return install_path, file_data
+
     def _verify_checksum_with_retry(self, file, file_data, install_path, expected_checksum, skip_checksum, package_name, is_update=False, backup_path=None):
         """Verify checksum with retry mechanism. Returns True if successful, False if failed after all retries."""
         if not expected_checksum or skip_checksum:
@@ -2628,7 +3045,6 @@ class PaxD:
         for attempt in range(max_retries):
             if attempt > 0:
                 print(f"{Fore.YELLOW}Checksum verification failed, retrying in {wait_times[attempt]} seconds... (attempt {attempt + 1}/{max_retries}) {'(using cachebuster)' if attempt == 2 else ''}")
-                import time
                 time.sleep(wait_times[attempt])
                 
                 # Re-download the file for retry
@@ -2639,22 +3055,24 @@ class PaxD:
                 if attempt == 2:
                     # Add cachebuster query parameter, by adding ?t={current time}
                     file_url += f"?t={int(time.time())}"
-                file_response = requests.get(file_url, headers=self.headers, allow_redirects=True)  # type: ignore
+                file_response = self._session.get(file_url, allow_redirects=True, stream=True)  # type: ignore
                 file_response.raise_for_status()
-                file_data = file_response.content
                 
-                # Write the re-downloaded file
+                # Write the re-downloaded file straight from the socket to disk
+                file_response.raw.decode_content = True
                 with open(install_path, 'wb') as f:
-                    f.write(file_data)
+                    shutil.copyfileobj(file_response.raw, f)
                 time.sleep(0.2)  # Small delay to ensure file write is flushed
             
             self._verbose_print(f"Verifying checksum for {file}: expected {expected_checksum} (attempt {attempt + 1})")
             
-            # Calculate checksum using same method as hasher.py
-            with open(install_path, "rb") as f:
-                content = f.read()
-            stripped_content = content.strip()
-            calculated_checksum = f"sha256:{hashlib.sha256(stripped_content).hexdigest()}"
+            # Calculate checksum using same method as hasher.py - the first attempt hashes the downloaded bytes we already
+            # have in memory (no re-read from disk, so no waiting for the write to flush), retries hash the re-downloaded file
+            if attempt == 0 and file_data is not None:
+                import hashlib
+                calculated_checksum = f"sha256:{hashlib.sha256(file_data.strip()).hexdigest()}"
+            else:
+                calculated_checksum = f"sha256:{_stripped_sha256(install_path)}"
             
             self._verbose_print(f"Attempt {attempt + 1} - Calculated: {calculated_checksum}, Expected: {expected_checksum}")
             
@@ -2680,29 +3098,31 @@ class PaxD:
                 
             # For install, clean up partial installation
             if not is_update:
-                local_app_data = os.path.join(os.path.expandvars(r"%LOCALAPPDATA%"), "PaxD")
+                local_app_data = self.local_app_data
                 package_path = os.path.join(local_app_data, package_name)
                 if os.path.exists(package_path):
                     print(f"{Fore.RED}Removing partially installed package due to checksum failure...")
                     shutil.rmtree(package_path, onerror=permission_handler)
+                    self._installed_set_cache = None
                     print(f"{Fore.RED}Package {package_name} installation aborted due to checksum verification failure")
         
         return False
     
     def _cleanup_orphaned_dependencies(self, package_name: str, current_dependencies: set):
         """Remove dependencies that are no longer needed."""
-        local_app_data = os.path.join(os.path.expandvars(r"%LOCALAPPDATA%"), "PaxD")
+        local_app_data = self.local_app_data
         
         # Get the old dependencies from a previous install/update
         old_deps_file = os.path.join(local_app_data, package_name, ".DEPENDENCIES")
-        old_dependencies = set()
-        
-        if os.path.exists(old_deps_file):
-            with open(old_deps_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        old_dependencies.add(line)
+        try:
+            old_dependencies = set(PathLib(old_deps_file).read_text().split())
+        except FileNotFoundError:
+            old_dependencies = set()
+
+        if old_dependencies == current_dependencies:
+            # Nothing was added or removed - no references to drop, and the file is already current
+            self._verbose_print(f"Dependencies of {package_name} unchanged, skipping cleanup")
+            return
         
         # Find dependencies that are no longer needed
         removed_dependencies = old_dependencies - current_dependencies
@@ -2713,43 +3133,36 @@ class PaxD:
                 self._remove_dependency_reference(paxd_package, package_name)
         
         # Save current dependencies for future cleanup
-        with open(old_deps_file, 'w') as f:
-            for dep in sorted(current_dependencies):
-                f.write(f"{dep}\n")
+        PathLib(old_deps_file).write_text("".join(f"{dep}\n" for dep in sorted(current_dependencies)))
     
     def _remove_dependency_reference(self, dependency_package: str, parent_package: str):
         """Remove a parent package reference from a dependency and uninstall if orphaned."""
-        local_app_data = os.path.join(os.path.expandvars(r"%LOCALAPPDATA%"), "PaxD")
+        local_app_data = self.local_app_data
         dependency_path = os.path.join(local_app_data, dependency_package)
         
         if not os.path.exists(dependency_path):
             return
         
-        dependency_file = os.path.join(dependency_path, ".DEPENDENCY")
-        if not os.path.exists(dependency_file):
+        depgraph = self._load_depgraph()
+        if dependency_package not in depgraph:
             return
         
-        # Read current dependent packages
-        dependent_packages = set()
-        with open(dependency_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and line != parent_package:
-                    dependent_packages.add(line)
+        # Drop this parent from the dependent packages
+        dependent_packages = depgraph[dependency_package]
+        dependent_packages.discard(parent_package)
         
         if dependent_packages:
-            # Still has dependencies, update the file
-            with open(dependency_file, 'w') as f:
-                for pkg in sorted(dependent_packages):
-                    f.write(f"{pkg}\n")
+            # Still has dependencies, update the graph
+            self._save_depgraph()
             print(f"Removed dependency reference from '{dependency_package}' to '{parent_package}'")
         else:
             # Check if this package is user-installed before removing
             user_installed_file = os.path.join(dependency_path, ".USER_INSTALLED")
             if os.path.exists(user_installed_file):
                 print(f"'{dependency_package}' is user-installed, keeping despite no remaining dependencies")
-                # Remove the .DEPENDENCY file since it's no longer needed
-                os.remove(dependency_file)
+                # Remove the graph entry since it's no longer needed
+                del depgraph[dependency_package]
+                self._save_depgraph()
             else:
                 # No more dependencies and not user-installed, this package is orphaned
                 print(f"Dependency '{dependency_package}' is no longer needed, removing...")
@@ -2762,17 +3175,14 @@ class PaxD:
         """Update all installed packages."""
         print(f"{Fore.BLUE}Updating all installed packages...")
         
-        local_app_data = os.path.join(os.path.expandvars(r"%LOCALAPPDATA%"), "PaxD")
+        local_app_data = self.local_app_data
         if not os.path.exists(local_app_data):
             print(f"{Fore.YELLOW}No packages are installed.")
             return
         
-        # Find all installed packages
-        installed_packages = []
-        for item in os.listdir(local_app_data):
-            package_path = os.path.join(local_app_data, item)
-            if os.path.isdir(package_path) and item != ".metapackages" and item != "extensions":
-                installed_packages.append(item)
+        # Find all installed packages (DirEntry.is_dir() comes from the directory listing, no extra stat per entry)
+        with os.scandir(local_app_data) as entries:
+            installed_packages = [entry.name for entry in entries if entry.name not in (".metapackages", ".metacache", "extensions") and entry.is_dir()]
         
         if not installed_packages:
             print(f"{Fore.YELLOW}No packages are installed.")
@@ -2783,25 +3193,24 @@ class PaxD:
         updated_count = 0
         failed_count = 0
         
+        # The "has anything changed?" checks are pure network round-trips, so run them all concurrently up front.
+        # The updates themselves stay sequential (they prompt, run pip and share dependency state), but packages
+        # that haven't changed then hit the prefetched result instead of waiting on their own request.
+        def prefetch_unchanged(package):
+            try:
+                self._metadata_unchanged(package, os.path.join(local_app_data, package))
+            except Exception as e:
+                self._verbose_print(f"Failed to pre-check {package} for updates: {e}")
+
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(prefetch_unchanged, installed_packages))
+        
         for package in installed_packages:
             try:
                 print(f"\n{Fore.BLUE}--- Checking {Fore.CYAN}{package}{Fore.BLUE} for updates ---")
-                # Save the current output state to track if update actually happened
-                old_version_file = os.path.join(local_app_data, package, ".VERSION")
-                old_version = None
-                if os.path.exists(old_version_file):
-                    with open(old_version_file, 'r') as f:
-                        old_version = f.read().strip()
-                
-                self.update(package)
-                
-                # Check if version actually changed
-                new_version = None
-                if os.path.exists(old_version_file):
-                    with open(old_version_file, 'r') as f:
-                        new_version = f.read().strip()
-                
-                if old_version != new_version:
+                # update() reports whether the installed version actually changed
+                if self.update(package):
                     updated_count += 1
                     
             except Exception as e:
@@ -2818,34 +3227,42 @@ class PaxD:
         
     def export(self):
         """Export a list of all packages, to an export.paxd file."""
-        local_app_data = os.path.join(os.path.expandvars(r"%LOCALAPPDATA%"), "PaxD")
+        local_app_data = self.local_app_data
         export_file = os.path.join(local_app_data, "export.paxd")
 
-        with open(export_file, 'w') as f:
-            for item in os.listdir(local_app_data):
+        exported = []
+        with os.scandir(local_app_data) as entries:
+            for entry in entries:
+                item = entry.name
                 if item == "com.mralfiem591.paxd":
                     print(f"Skipping PaxD core package: {item}")
                     continue
-                if item == "bin":
+                if item == "bin" or item == ".metacache":
                     continue
-                package_path = os.path.join(local_app_data, item)
-                if os.path.isdir(package_path):
+                if entry.is_dir():
                     self._verbose_print(f"Exporting package: {item}")
-                    f.write(f"{item}\n")
+                    exported.append(item)
+
+        PathLib(export_file).write_text("".join(f"{item}\n" for item in exported))
 
         print(f"Exported package list to {export_file}")
         
     def import_paxd(self): # used import_paxd() because import() is not usable (as it includes import, a python thing)
         """Import and install packages from an export.paxd file."""
-        local_app_data = os.path.join(os.path.expandvars(r"%LOCALAPPDATA%"), "PaxD")
+        local_app_data = self.local_app_data
         import_file = os.path.join(local_app_data, "export.paxd")
 
         if not os.path.exists(import_file):
             print(f"{Fore.RED}Import file not found: {import_file}")
             return
 
-        with open(import_file, 'r') as f:
-            packages_to_install = [line.strip() for line in f if line.strip()]
+        # split() drops blank lines and surrounding whitespace in one pass; dict.fromkeys removes duplicates while keeping order
+        packages_to_install = list(dict.fromkeys(PathLib(import_file).read_text().split()))
+        installed = self._installed_set()
+        already_installed = [name for name in packages_to_install if name.lower() in installed]
+        if already_installed:
+            print(f"{Fore.YELLOW}Skipping {len(already_installed)} already installed package(s): {', '.join(already_installed)}")
+            packages_to_install = [name for name in packages_to_install if name.lower() not in installed]
 
         print(f"{Fore.BLUE}Importing and installing packages from {import_file}...")
         for package_name in packages_to_install:
@@ -2859,7 +3276,9 @@ class PaxD:
 
     def url_warning_message(self, action: str):
         """Display a warning message about using paxd:// URLs."""
-        os.system('cls')
+        # Clear the console with ANSI codes (translated by colorama on older consoles) rather than spawning cmd for 'cls'
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
         print(f"{Fore.YELLOW}Warning: You have opened a link to preform the command '{Fore.CYAN}{action}{Fore.YELLOW}' using the paxd:// protocol.")
         print(f"{Fore.YELLOW}Ensure you trust the source of this link before proceeding.")
         if input("\nWould you like to continue? (Y/n): ").strip().lower() == 'n':
@@ -2885,58 +3304,40 @@ class PaxD:
                 params = ""
 
             self._verbose_print(f"Processing URL action: {action}, params: {params}")
+            # Optional query parameters (e.g., paxd://install/package-name?skip-checksum=true) are ignored for now
+            target = params.split('?')[0]
 
-            if action == "install":
-                if not params:
-                    print(f"{Fore.RED}Package name required for install action")
-                    return
-                # Handle install with optional parameters (e.g., paxd://install/package-name?skip-checksum=true)
-                package_name = params.split('?')[0]  # Remove query parameters for now
-                print(f"{Fore.BLUE}Installing package from URL: {Fore.CYAN}{package_name}")
-                self.url_warning_message(f"install {package_name}")
-                self.install(package_name, user_requested=True)
-                
-            elif action == "uninstall":
-                if not params:
-                    print(f"{Fore.RED}Package name required for uninstall action")
-                    return
-                package_name = params.split('?')[0]
-                print(f"{Fore.BLUE}Uninstalling package from URL: {Fore.CYAN}{package_name}")
-                self.url_warning_message(f"uninstall {package_name}")
-                self.uninstall(package_name)
-                
-            elif action == "info":
-                if not params:
-                    print(f"{Fore.RED}Package name required for info action")
-                    return
-                package_name = params.split('?')[0]
-                print(f"{Fore.BLUE}Showing info for package from URL: {Fore.CYAN}{package_name}")
-                self.info(package_name)
-                input("Press Enter to continue...")
-                
-            elif action == "search":
-                if not params:
-                    print(f"{Fore.RED}Search term required for search action")
-                    return
-                search_term = params.split('?')[0]
-                print(f"{Fore.BLUE}Searching from URL: {Fore.CYAN}{search_term}")
-                self.search(search_term)
-                input("Press Enter to continue...")
-                
-            elif action == "update":
-                if params:
-                    package_name = params.split('?')[0]
-                    print(f"{Fore.BLUE}Updating package from URL: {Fore.CYAN}{package_name}")
-                    self.url_warning_message(f"update {package_name}")
-                    self.update(package_name)
-                else:
+            # action -> (handler, banner, missing-target message, show the trust warning, pause afterwards)
+            handlers = {
+                "install": (lambda name: self.install(name, user_requested=True), "Installing package from URL", "Package name required for install action", True, False),
+                "uninstall": (self.uninstall, "Uninstalling package from URL", "Package name required for uninstall action", True, False),
+                "info": (self.info, "Showing info for package from URL", "Package name required for info action", False, True),
+                "search": (self.search, "Searching from URL", "Search term required for search action", False, True),
+                "update": (self.update, "Updating package from URL", None, True, False),
+            }
+            handler = handlers.get(action)
+            if handler is None:
+                print(f"{Fore.RED}Unknown URL action: {action}")
+                print(f"{Fore.YELLOW}Supported actions: {', '.join(handlers)}")
+                return
+
+            method, banner, missing_message, warn, pause = handler
+            if not target:
+                if action == "update":
+                    # paxd://update with no package updates everything
                     print(f"{Fore.BLUE}Updating all packages from URL")
                     self.url_warning_message("update-all")
                     self.update_all()
-                    
-            else:
-                print(f"{Fore.RED}Unknown URL action: {action}")
-                print(f"{Fore.YELLOW}Supported actions: install, uninstall, info, search, update")
+                else:
+                    print(f"{Fore.RED}{missing_message}")
+                return
+
+            print(f"{Fore.BLUE}{banner}: {Fore.CYAN}{target}")
+            if warn:
+                self.url_warning_message(f"{action} {target}")
+            method(target)
+            if pause:
+                input("Press Enter to continue...")
 
         except Exception as e:
             print(f"{Fore.RED}Error processing URL {url}: {e}")
@@ -2966,27 +3367,23 @@ class PaxD:
                 return False
 
             # Get the path to paxd executable
-            paxd_path = os.path.abspath(__file__)
+            paxd_path = CURRENT_FILE_PATH
             python_path = sys.executable
             
             # Create the registry entries
             protocol_key = r"SOFTWARE\\Classes\\paxd"
             
-            # Create main protocol key
-            with winreg.CreateKey(winreg.HKEY_LOCAL_MACHINE, protocol_key) as key:
+            # Create the protocol key once, and write every value through that handle.
+            # SetValue creates the DefaultIcon and shell\\open\\command subkeys relative to it,
+            # instead of each one being opened separately from HKEY_LOCAL_MACHINE
+            with winreg.CreateKeyEx(winreg.HKEY_LOCAL_MACHINE, protocol_key, 0, winreg.KEY_ALL_ACCESS) as key:
                 winreg.SetValue(key, "", winreg.REG_SZ, "PaxD Package Manager Protocol")
                 winreg.SetValueEx(key, "URL Protocol", 0, winreg.REG_SZ, "")
-            
-            # Create DefaultIcon key
-            with winreg.CreateKey(winreg.HKEY_LOCAL_MACHINE, f"{protocol_key}\\DefaultIcon") as key:
                 # Use Python executable icon as default
-                winreg.SetValue(key, "", winreg.REG_SZ, f'"{python_path}",0')
-            
-            # Create shell\\open\\command key
-            with winreg.CreateKey(winreg.HKEY_LOCAL_MACHINE, f"{protocol_key}\\shell\\open\\command") as key:
+                winreg.SetValue(key, "DefaultIcon", winreg.REG_SZ, f'"{python_path}",0')
                 # Command to execute when URL is clicked: "python" "paxd.py" url "%1"
                 command = f'"{python_path}" "{paxd_path}" url "%1"'
-                winreg.SetValue(key, "", winreg.REG_SZ, command)
+                winreg.SetValue(key, "shell\\open\\command", winreg.REG_SZ, command)
                 
             print(f"{Fore.GREEN}Successfully registered paxd:// URL protocol handler!")
             print(f"{Fore.BLUE}You can now use URLs like: paxd://install/package-name")
@@ -3022,6 +3419,16 @@ class PaxD:
                 print(f"{Fore.YELLOW}Please run as administrator: paxd register-protocol --unregister")
                 return False
             
+            # Delete the entire protocol key tree in one call where RegDeleteTreeW is available (Vista+)
+            try:
+                result = ctypes.windll.advapi32.RegDeleteTreeW(ctypes.c_void_p(winreg.HKEY_LOCAL_MACHINE), r"SOFTWARE\Classes\paxd")  # type: ignore
+            except AttributeError:
+                result = None
+            if result == 0:
+                print(f"{Fore.GREEN}Successfully unregistered paxd:// URL protocol handler!")
+                return True
+            self._verbose_print(f"RegDeleteTreeW unavailable or failed ({result}), deleting protocol keys one by one")
+
             try:
                 # Delete the entire protocol key tree
                 winreg.DeleteKey(winreg.HKEY_LOCAL_MACHINE, f"{protocol_key}\\shell\\open\\command")
@@ -3062,7 +3469,7 @@ class PaxD:
                             print(f"{Fore.BLUE}Handler command: {Fore.WHITE}{command_value}")
                             
                             # Check if the command points to the current PaxD installation
-                            current_paxd_path = os.path.abspath(__file__)
+                            current_paxd_path = CURRENT_FILE_PATH
                             current_python_path = sys.executable
                             expected_command = f'"{current_python_path}" "{current_paxd_path}" url "%1"'
                             
@@ -3092,12 +3499,20 @@ class PaxD:
             print(f"{Fore.RED}Error checking protocol handler: {e}")
             return False
 
-PaxD()._verbose_print("IMPORTANT: please ignore the numbers stated at the left side of each log key! They are purely to make sorting easier for our bug trackers systems. They are lexicographic for a reason! (because our bug tracker can only read lexicographic ordering for some reason lol)", mode=2)
+# One shared instance for the module-level log lines and the argument parser, rather than constructing PaxD for each
+_paxd_boot = PaxD()
 
-import datetime
-PaxD()._verbose_print(f"PaxD v{PaxD().paxd_version} initialized at {datetime.datetime.now().strftime('%H:%M:%S.%f')[:-3]} :)")
+_paxd_boot._verbose_print("IMPORTANT: please ignore the numbers stated at the left side of each log key! They are purely to make sorting easier for our bug trackers systems. They are lexicographic for a reason! (because our bug tracker can only read lexicographic ordering for some reason lol)", mode=2)
+
+_paxd_boot._verbose_print(f"PaxD v{_paxd_boot.paxd_version} initialized :)") # every log entry is already timestamped by _verbose_print
 
-PaxD()._verbose_print("if you are reading this, you just lost the game :D") # humour in a non-intrusive way :)... also sorry not sorry
+_paxd_boot._verbose_print("if you are reading this, you just lost the game :D") # humour in a non-intrusive way :)... also sorry not sorry
+
+# How often (in seconds) main() asks the repository for a newer PaxD version
+UPDATE_CHECK_INTERVAL = 6 * 60 * 60
+
+# Commands that fetch from the repository - only these show the repository status message
+REMOTE_COMMANDS = {"install", "uninstall", "update", "update-all", "reinstall", "info", "search", "repo-info", "import", "url"}
 
 def create_argument_parser():
     """Create and configure the argument parser for PaxD CLI."""
@@ -3129,7 +3544,7 @@ def create_argument_parser():
     parser.add_argument(
         '--version',
         action='version',
-        version=f'PaxD {PaxD().paxd_version}: {PaxD().paxd_version_phrase}'
+        version=f'PaxD {_paxd_boot.paxd_version}: {_paxd_boot.paxd_version_phrase}'
     )
     
     # Create subparsers for commands
@@ -3392,9 +3807,357 @@ def create_argument_parser():
         description='Show all installed PaxD extensions'
     )
     
+    # Attach each command's handler to its subparser, so main() can call args.func directly
+    for command, handler in COMMANDS.items():
+        subparsers.choices[command].set_defaults(func=handler)
+    
     # Return parser, with all commands
     return parser
 
+def _latest_paxd_version(paxd):
+    """Return the latest PaxD version, asking the repository at most once every UPDATE_CHECK_INTERVAL seconds."""
+    check_file = os.path.join(PAXD_PACKAGE_DIR, ".LATEST_VERSION")
+    try:
+        if time.time() - os.path.getmtime(check_file) < UPDATE_CHECK_INTERVAL:
+            # The file holds the latest version and the PaxD version that was running when it was checked - once PaxD
+            # itself has changed (updated, reinstalled...) the saved answer is stale and could even point backwards
+            latest_version, _, checked_by = PathLib(check_file).read_text().strip().partition("\n")
+            if checked_by == paxd.paxd_version:
+                paxd._verbose_print("Using recently checked PaxD version")
+                return latest_version or None
+            paxd._verbose_print("PaxD changed since the last update check, checking again")
+    except FileNotFoundError:
+        pass
+
+    paxd._verbose_print("Checking for PaxD updates")
+    latest_version = paxd.get_latest_version()
+    if latest_version:
+        try:
+            _atomic_write(check_file, f"{latest_version}\n{paxd.paxd_version}")
+        except OSError as e:
+            paxd._verbose_print(f"Failed to save latest PaxD version: {e}")
+    return latest_version
+
+def _install_paxd_dependencies(paxd):
+    """Install the dependencies of com.mralfiem591.paxd itself, as part of first time initialization."""
+    print("Installing PaxD dependencies...")
+    # Fetch dependenices from the paxd file in the repository
+    try:
+        repo_url = paxd._read_repository_url()
+        repo_url = paxd._resolve_repository_url(repo_url)
+        package_data, source_file = paxd._fetch_package_metadata(repo_url, "com.mralfiem591.paxd")
+        paxd._verbose_print(f"Successfully fetched PaxD metadata from {source_file}")
+        install_info = package_data.get('install', {})
+        dependencies = install_info.get('depend', [])
+
+        # Sort the dependencies first, so pip packages can all go to uv in one call at the end
+        # (kept separate from the global PIP_PACKAGES, which the nested paxd installs below use and clear)
+        paxd_packages = []
+        pip_packages = []
+        # Dependency type -> list it is collected into (add more dependency types as needed)
+        dependency_lists = {"paxd": paxd_packages, "pip": pip_packages}
+        for dep in dependencies:
+            dep_type, _, name = dep.partition(":")
+            dependency_list = dependency_lists.get(dep_type)
+            if dependency_list is None:
+                print(f"Unknown dependency type for '{dep}'")
+                continue
+            dependency_list.append(name)
+        needs_uv = "uv" in pip_packages
+        if needs_uv:
+            pip_packages.remove("uv")
+
+        # uv has to be bootstrapped with pip, everything else is installed by uv
+        # (including the pip dependencies of the packages installed below, so this has to come before them)
+        if needs_uv:
+            if shutil.which('uv') is not None:
+                paxd._verbose_print("UV is already installed, skipping UV installation")
+            else:
+                subprocess.run([sys.executable, '-m', 'pip', 'install', 'uv'])
+
+        # Packages PaxD always installs for the user, unless a previous (partial) init already did
+        user_packages = [name for name in ('com.mralfiem591.vulnerability', 'com.mralfiem591.paxd-gui')
+                         if not os.path.exists(os.path.join(LOCAL_APP_DATA_PAXD, name, ".VERSION"))]
+
+        # Download every package's metadata concurrently first; the installs below then only revalidate
+        # it (304 Not Modified) instead of each waiting on a full download in turn
+        def prefetch_metadata(name):
+            try:
+                paxd._fetch_package_metadata(repo_url, name, parallel=False)
+            except Exception as e:
+                paxd._verbose_print(f"Failed to prefetch metadata for {name}: {e}")
+
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(prefetch_metadata, user_packages + paxd_packages))
+
+        # Installing writes to shared state (dependency graph, bin folder, pip), so it stays sequential
+        for user_package in user_packages:
+            paxd.install(user_package, user_requested=True)
+        for paxd_package in paxd_packages:
+            paxd.install(paxd_package, user_requested=False)
+
+        # Now install pip dependencies
+        if pip_packages:
+            paxd._verbose_print(f"Installing PaxD pip dependencies: {pip_packages}")
+            pip_install_command = ['uv', 'pip', 'install', '--system', '--python', sys.executable] + pip_packages
+            result = subprocess.run(pip_install_command, capture_output=True, text=True)
+            if result.returncode != 0:
+                print(f"{Fore.RED}Pip installation failed: {result.stderr}")
+            else:
+                print(f"{Fore.GREEN}Pip dependencies installed successfully.")
+    except Exception as e:
+        print(f"{Fore.RED}Failed to install PaxD dependencies: {e}")
+
+def _perform_first_time_init(paxd):
+    """Run PaxD's first time initialization (used by both .FIRSTRUN and the init command)."""
+    # 1. Create bin directory
+    bin_path = BIN_DIR
+    os.makedirs(bin_path, exist_ok=True)
+        
+    # 2. Add bin directory to PATH permanently
+    # Note that paxd is Windows only, so no need to check OS
+    if not os.path.exists(os.path.join(PAXD_DIR, ".BINSKIP")):
+        # Check if we have administrator permission, if not, prompt the user to run as admin and exit
+        if not is_admin():
+            print("Please run this script as an administrator, for first time init only.")
+            exit(1)
+        # Add the bin folder to path
+        if not add_to_path(bin_path):
+            print(f"Failed to add bin folder to PATH. Try manually adding '{bin_path}' to your PATH, and make a .BINSKIP file alongside paxd.")
+            exit(1)
+            
+    # 3. Create a paxd.bat in the bin path
+    paxd_bin_path = os.path.join(bin_path, "paxd.bat")
+    try:
+        # 'x' creates the file only if it doesn't exist yet, so no separate existence check is needed
+        with open(paxd_bin_path, 'x') as f:
+            f.write(PAXD_BAT_CONTENT)
+        print(f"Created paxd.bat at {paxd_bin_path}")
+    except FileExistsError:
+        pass
+    
+    # 4. Register PaxD itself as user-installed and version PaxD
+    print("Registering PaxD itself...")
+    paxd_package_path = PAXD_PACKAGE_DIR
+    
+    # Create PaxD's package directory if it doesn't exist
+    os.makedirs(paxd_package_path, exist_ok=True)
+    
+    # Create version file for PaxD if it doesn't exist
+    version_file = os.path.join(paxd_package_path, ".VERSION")
+    try:
+        with open(version_file, 'x') as f:
+            f.write(paxd.paxd_version)
+        print(f"Created version file for PaxD: {paxd.paxd_version}")
+    except FileExistsError:
+        pass
+    
+    # Mark PaxD as user-installed if not already marked
+    user_installed_file = os.path.join(paxd_package_path, ".USER_INSTALLED")
+    try:
+        with open(user_installed_file, 'x') as f:
+            f.write(f"PaxD installed by user on {datetime.datetime.now().isoformat()}")
+        print(f"{Fore.GREEN}Marked PaxD as user-installed")
+    except FileExistsError:
+        pass
+        
+    # 5. Install dependencies of com.mralfiem591.paxd
+    _install_paxd_dependencies(paxd)
+        
+    # 6. Register paxd:// URL protocol (requires admin rights, so optional)
+    print("Registering paxd:// URL protocol...")
+    if paxd.register_protocol():
+        print(f"{Fore.GREEN}URL protocol registered successfully!")
+    else:
+        print(f"{Fore.YELLOW}URL protocol registration skipped (requires admin rights)")
+        print(f"{Fore.YELLOW}You can register it later with: paxd register-protocol")
+        
+    # 7. Delete the .FIRSTRUN file
+    try:
+        os.remove(os.path.join(PAXD_DIR, ".FIRSTRUN"))
+    except FileNotFoundError:
+        pass
+    print(f"{Fore.GREEN}PaxD first time run initialization complete.")
+    print(f"\n{Fore.CYAN}Welcome to PaxD!{Style.RESET_ALL}\nIt is recommended you try out PaxD with our {Fore.YELLOW}paxd-test{Style.RESET_ALL} package - install it with {Fore.GREEN}`paxd install paxd-test`{Style.RESET_ALL}, and run paxd-test to see it in action!\n\nYou can uninstall it later with {Fore.RED}`paxd uninstall paxd-test`{Style.RESET_ALL}.\n\nRecommended next step: register paxd:// urls with {Fore.GREEN}`paxd register-protocol`{Style.RESET_ALL} (requires admin rights)\n")
+
+# Command handlers for main(). Each takes the PaxD instance and the parsed arguments;
+# returning False ends main() straight away (skipping the update check), like the old early returns
+def _cmd_install(paxd, args):
+    paxd._verbose_print(f"Installing package: {args.package_name}, skip_checksum={args.skip_checksum}")
+    paxd.install(args.package_name, user_requested=True, skip_checksum=args.skip_checksum)
+
+def _cmd_uninstall(paxd, args):
+    paxd._verbose_print(f"Uninstalling package: {args.package_name}")
+    # Check if it's an extension before trying package uninstall
+    if paxd._check_if_extension(args.package_name):
+        print(f"'{args.package_name}' appears to be an extension, not a package.")
+        print(f"To uninstall extensions, use: paxd extension uninstall {args.package_name}")
+    else:
+        paxd.uninstall(args.package_name)
+
+def _cmd_update(paxd, args):
+    force_flag = args.force if hasattr(args, 'force') else False
+    paxd._verbose_print(f"Updating package: {args.package_name}, force={force_flag}, skip_checksum={args.skip_checksum}")
+    # Check if it's an extension before trying package update
+    if paxd._check_if_extension(args.package_name):
+        print(f"'{args.package_name}' appears to be an extension, not a package.")
+        print(f"To update extensions, use: paxd extension update {args.package_name}")
+    else:
+        paxd.update(args.package_name, force=force_flag, skip_checksum=args.skip_checksum)
+
+def _cmd_update_all(paxd, args):
+    paxd._verbose_print("Updating all packages")
+    paxd.update_all()
+
+def _cmd_info(paxd, args):
+    paxd._verbose_print(f"Getting info for package: {args.package_name}")
+    paxd.info(args.package_name, args.fullsize)
+
+def _cmd_search(paxd, args):
+    paxd._verbose_print(f"Searching for: {args.search_term}")
+    # Note: search_term is used instead of package_name for search
+    paxd.search(args.search_term)
+
+def _cmd_repo_info(paxd, args):
+    paxd._verbose_print("Getting repository info")
+    paxd.show_repo_info()
+
+_EGG_MESSAGES = (
+    "Kris Get The Banana\n\nPotassium",
+    "NOWS YOUR CHANCE TO BE A [[Big Shot]]",
+    "WHAT GIVES PEOPLE FEELINGS OF POWER:\n\nMONEY: ██\nSTATUS: ███\nBEATING JEVIL FIRST TRY: ████████████████████",
+    f"{Fore.MAGENTA}██     {Fore.YELLOW}██{Style.RESET_ALL}\n\nTHE POWER OF PATTERN RECOGNITION",
+    "* You said you were a GAMER!!!\n\n* I Only Play Mobile Games\n\n* NOOOOOOOOOOOO!!!",
+)
+
+def _cmd_reinstall(paxd, args):
+    if args.package_name == "deltarunedeltarune":
+        # sneaky sneaky easter egg
+        import random
+        print(random.choice(_EGG_MESSAGES))
+        exit(0)
+    paxd._verbose_print(f"Reinstalling package: {args.package_name}")
+    if args.package_name == "com.mralfiem591.paxd":
+        print(f"{Fore.RED}Cannot reinstall PaxD itself using PaxD. Please uninstall manually.")
+        print(f"{Fore.YELLOW}Reinstalling PaxD itself requires manual uninstallation and reinstallation.")
+        print(f"{Fore.YELLOW}Please uninstall PaxD manually, then download and install the latest version from the PaxD repository.")
+        return False
+    paxd.uninstall(args.package_name)
+    paxd.install(args.package_name, user_requested=True)
+
+def _cmd_credit(paxd, args):
+    paxd._verbose_print("Showing credits")
+    paxd.credit()
+
+def _cmd_packagedir(paxd, args):
+    paxd._verbose_print("Opening package directory")
+    # startfile hands the folder straight to the shell, without going through cmd.exe
+    os.startfile(LOCAL_APP_DATA_PAXD)  # type: ignore (Windows only)
+
+def _cmd_repo(paxd, args):
+    paxd._verbose_print("Opening repository in browser")
+    os.startfile(paxd._resolve_repository_url(paxd._read_repository_url()))  # type: ignore (Windows only)
+
+def _cmd_listall(paxd, args):
+    paxd._verbose_print("Listing all installed packages")
+    paxd.list_installed()
+
+def _cmd_export(paxd, args):
+    paxd._verbose_print("Exporting installed packages")
+    paxd.export()
+
+def _cmd_import(paxd, args):
+    paxd._verbose_print("Importing packages from export.paxd")
+    paxd.import_paxd()
+
+def _cmd_init(paxd, args):
+    if not args.y:
+        if input(Fore.RED + Style.BRIGHT + "Are you SURE you want to complete first time initialization? This should only ever be done ONCE! Type 'YES' in full capitals to continue.") != "YES":
+            print(f"{Fore.YELLOW}Initialization cancelled by user.")
+            return False
+    paxd._verbose_print("Performing first time initialization via init command")
+    _perform_first_time_init(paxd)
+
+def _cmd_gui(paxd, args):
+    paxd._verbose_print("Launching PaxD GUI")
+    try:
+        # Look paxd-gui up on PATH directly, installing it first if it isn't there
+        gui_exe = shutil.which('paxd-gui')
+        if gui_exe is None:
+            paxd.install("com.mralfiem591.paxd-gui", user_requested=True)
+            gui_exe = shutil.which('paxd-gui') or os.path.join(BIN_DIR, "paxd-gui.bat")
+        subprocess.run([gui_exe, 'ran-via-paxd'], check=True)
+    finally:
+        # Handle uninstall requests from the GUI
+        paxd._verbose_print("Checking for uninstall requests from GUI")
+        # The GUI can't be uninstalled while it's still running, so its requests are only handled once it has exited
+        messages = paxd_sdk.Messaging.GetMessages('com.mralfiem591.paxd')
+        uninstall_request = next((message for message in messages
+                                  if message['from'] == 'com.mralfiem591.paxd-gui' and message['message'].get('queue_gui_uninstall') == True), None)
+        if uninstall_request is not None:
+            print(f"Received uninstall request from GUI (sent time: {uninstall_request['timestamp']}), uninstalling PaxD GUI!")
+            paxd.uninstall("com.mralfiem591.paxd-gui")
+            paxd_sdk.Messaging.ClearMessages('com.mralfiem591.paxd')
+
+def _cmd_url(paxd, args):
+    paxd._verbose_print(f"Processing URL: {args.url}")
+    paxd.handle_url(args.url)
+
+def _cmd_register_protocol(paxd, args):
+    if args.unregister:
+        paxd._verbose_print("Unregistering paxd:// protocol")
+        paxd.unregister_protocol()
+    else:
+        paxd._verbose_print("Registering paxd:// protocol")
+        paxd.register_protocol()
+
+def _cmd_check_protocol(paxd, args):
+    paxd._verbose_print("Checking paxd:// protocol registration")
+    paxd.check_protocol_status()
+
+def _cmd_extension(paxd, args):
+    if args.extension_command == "install":
+        paxd._verbose_print(f"Installing extension: {args.zip_path}")
+        ext_manager.install_extension(args.zip_path)
+    elif args.extension_command == "uninstall":
+        paxd._verbose_print(f"Uninstalling extension: {args.extension_name}")
+        ext_manager.uninstall_extension(args.extension_name)
+    elif args.extension_command == "update":
+        zip_path = getattr(args, 'zip_path', None)
+        paxd._verbose_print(f"Updating extension: {args.extension_name}, zip_path={zip_path}")
+        ext_manager.update_extension(args.extension_name, zip_path)
+    elif args.extension_command == "list":
+        paxd._verbose_print("Listing installed extensions")
+        ext_manager.list_extensions()
+    else:
+        paxd._verbose_print(f"Unknown extension command: {args.extension_command}")
+        print(f"{Fore.RED}Unknown extension command: {args.extension_command}")
+
+# Command name -> handler, attached to each subparser as its func default by create_argument_parser
+COMMANDS = {
+    "install": _cmd_install,
+    "uninstall": _cmd_uninstall,
+    "update": _cmd_update,
+    "update-all": _cmd_update_all,
+    "info": _cmd_info,
+    "search": _cmd_search,
+    "repo-info": _cmd_repo_info,
+    "reinstall": _cmd_reinstall,
+    "credit": _cmd_credit,
+    "packagedir": _cmd_packagedir,
+    "repo": _cmd_repo,
+    "listall": _cmd_listall,
+    "export": _cmd_export,
+    "import": _cmd_import,
+    "init": _cmd_init,
+    "gui": _cmd_gui,
+    "url": _cmd_url,
+    "register-protocol": _cmd_register_protocol,
+    "check-protocol": _cmd_check_protocol,
+    "extension": _cmd_extension,
+}
+
 def main():
     # Initialize colorama for colored output
     init(autoreset=True) # type: ignore
@@ -3412,18 +4175,17 @@ def main():
         print(f"{Fore.YELLOW}Warning: No authentication token found. You may encounter rate limiting. It is highly recommended to set one up, and set PAXD_GH_TOKEN environment variable.{Style.RESET_ALL}")
         
     # If repository is unoptimised, optimise it
-    with open(os.path.join(os.path.dirname(__file__), "repository"), 'r+') as repo_file:
-        if repo_file.read().strip().startswith("optimised::"):
-            # Repository is already optimised - continue like normal
-            pass
-        else:
-            # Repository is unoptimised - optimise it by resolving it, and writing the resolved URL (lowers head requests needed during normal usage)
-            print("Repository is unoptimised - optimising...")
-            repo_optimised = f"optimised::{PaxD()._resolve_repository_url(PaxD()._read_repository_url())}"
-            # Clear the repository file, and write the optimised repo to it
-            repo_file.seek(0)
+    # Only the prefix is needed to tell, so read just that many bytes rather than the whole file
+    repository_path = os.path.join(PAXD_DIR, "repository")
+    with open(repository_path, 'rb') as repo_file:
+        repo_prefix = repo_file.read(len(b"optimised::"))
+    if repo_prefix != b"optimised::":
+        # Repository is unoptimised - optimise it by resolving it, and writing the resolved URL (lowers head requests needed during normal usage)
+        print("Repository is unoptimised - optimising...")
+        repo_optimised = f"optimised::{_paxd_boot._resolve_repository_url(_paxd_boot._read_repository_url())}"
+        # Replace the repository file contents with the optimised repo
+        with open(repository_path, 'w') as repo_file:
             repo_file.write(repo_optimised)
-            repo_file.truncate()
 
     # Create and parse arguments first
     parser = create_argument_parser()
@@ -3438,25 +4200,30 @@ def main():
     paxd = PaxD(verbose=args.verbose if hasattr(args, 'verbose') else False)
     
     # Set up extension manager with PaxD's verbose function
-    paxd_base_dir = os.path.join(os.path.expandvars(r"%LOCALAPPDATA%"), "PaxD")
-    ext_manager = ExtensionManager(paxd_base_dir, trigger_system, paxd._verbose_print)
+    ext_manager = ExtensionManager(LOCAL_APP_DATA_PAXD, trigger_system, paxd._verbose_print)
 
-    # Check for status messages
-    try:
-        repo = paxd._resolve_repository_url(paxd._read_repository_url())
-        if repo != "https://raw.githubusercontent.com/mralfiem591/paxd/refs/heads/main":
-            print(f"{Fore.YELLOW}Warning: You are using a custom repository: {repo}. PaxD cannot guarantee the authenticity or safety of packages from this source. {Style.BRIGHT}Proceed with caution!{Style.RESET_ALL}")
-        status = requests.get(f"{repo}/status", headers=paxd.headers, allow_redirects=True)
-        status.raise_for_status()
-
-        if status:
-            print(f"{Fore.YELLOW}Status Update on current repository:")
-            print()
-            print(f"{Fore.RED}{str(status.text).replace('lu', f'{Fore.YELLOW}Last updated:')}")
-            import time
-            time.sleep(2)
-    except Exception as e:
-        paxd._verbose_print(f"Error fetching status! {e}")
+    # Check for status messages (only for commands that actually talk to the repository)
+    if args.command in REMOTE_COMMANDS:
+        try:
+            repo = paxd._resolve_repository_url(paxd._read_repository_url())
+            if repo != "https://raw.githubusercontent.com/mralfiem591/paxd/refs/heads/main":
+                print(f"{Fore.YELLOW}Warning: You are using a custom repository: {repo}. PaxD cannot guarantee the authenticity or safety of packages from this source. {Style.BRIGHT}Proceed with caution!{Style.RESET_ALL}")
+            status = paxd._session.get(f"{repo}/status", allow_redirects=True)
+            status.raise_for_status()
+
+            if status.text.strip():
+                print(f"{Fore.YELLOW}Status Update on current repository:")
+                print()
+                print(f"{Fore.RED}{str(status.text).replace('lu', f'{Fore.YELLOW}Last updated:')}")
+                # Give the user a moment to read the status, scaled to its length (at most 2 seconds)
+                time.sleep(min(2, len(status.text) / 100))
+        except Exception as e:
+            paxd._verbose_print(f"Error fetching status! {e}")
+    else:
+        paxd._verbose_print(f"Skipping repository status check for local command: {args.command}")
+    
+    # Only load the SDK (and show its messages) once we know a real command is being run
+    _check_sdk_messages()
     
     if SDK_BACKUP:
         paxd._verbose_print("PaxD SDK missing - forcing install")
@@ -3464,135 +4231,41 @@ def main():
         print(f"{Fore.GREEN}PaxD SDK forced installation successful, please now rerun your previous command.{Style.RESET_ALL}")
         exit(1)
     
-    if os.path.exists(os.path.join(os.path.dirname(__file__), ".UPDATERUN")):
+    # Removing .UPDATERUN doubles as the check for it - it only exists straight after an update
+    try:
+        os.remove(os.path.join(PAXD_DIR, ".UPDATERUN"))
+    except FileNotFoundError:
+        pass
+    else:
         print(f"{Fore.GREEN}PaxD was updated! Welcome to PaxD {Fore.CYAN}{paxd.paxd_version}{Fore.GREEN}: {paxd.paxd_version_phrase}...{Style.RESET_ALL}\n")
-        os.remove(os.path.join(os.path.dirname(__file__), ".UPDATERUN"))
     
-    if os.path.exists(os.path.join(os.path.dirname(__file__), ".FIRSTRUN")):
+    if os.path.exists(os.path.join(PAXD_DIR, ".FIRSTRUN")):
         print(f"{Fore.YELLOW}PaxD first time run, initializing...")
-        # 1. Create bin directory
-        if not os.path.exists(os.path.join(os.path.dirname(__file__), "bin")):
-            os.makedirs(os.path.join(os.path.dirname(__file__), "bin"))
-            
-        # 2. Add bin directory to PATH permanently
-        # Note that paxd is Windows only, so no need to check OS
-        bin_path = os.path.join(os.path.dirname(__file__), "bin")
-        if not os.path.exists(os.path.join(os.path.dirname(__file__), ".BINSKIP")) and os.path.exists(bin_path):
-            # Check if we have administrator permission, if not, prompt the user to run as admin and exit
-            if not is_admin():
-                print("Please run this script as an administrator, for first time init only.")
-                exit(1)
-            # Add the bin folder to path
-            if not add_to_path(bin_path):
-                print(f"Failed to add bin folder to PATH. Try manually adding '{bin_path}' to your PATH, and make a .BINSKIP file alongside paxd.")
-                exit(1)
-                
-        # 3. Create a paxd.bat in the bin path
-        paxd_bin_path = os.path.join(bin_path, "paxd.bat")
-        if not os.path.exists(paxd_bin_path):
-            with open(paxd_bin_path, 'w') as f:
-                f.write(f"@echo off\n")
-                f.write(f'"{sys.executable}" "{os.path.abspath(__file__)}" %*\n')
-            print(f"Created paxd.bat at {paxd_bin_path}")
-        
-        # 4. Register PaxD itself as user-installed and version PaxD
-        print("Registering PaxD itself...")
-        local_app_data = os.path.join(os.path.expandvars(r"%LOCALAPPDATA%"), "PaxD")
-        paxd_package_path = os.path.join(local_app_data, "com.mralfiem591.paxd")
-        
-        # Create PaxD's package directory if it doesn't exist
-        os.makedirs(paxd_package_path, exist_ok=True)
-        
-        # Create version file for PaxD if it doesn't exist
-        version_file = os.path.join(paxd_package_path, ".VERSION")
-        if not os.path.exists(version_file):
-            with open(version_file, 'w') as f:
-                f.write(paxd.paxd_version)
-            print(f"Created version file for PaxD: {paxd.paxd_version}")
-        
-        # Mark PaxD as user-installed if not already marked
-        user_installed_file = os.path.join(paxd_package_path, ".USER_INSTALLED")
-        if not os.path.exists(user_installed_file):
-            with open(user_installed_file, 'w') as f:
-                f.write(f"PaxD installed by user on {__import__('datetime').datetime.now().isoformat()}")
-            print(f"{Fore.GREEN}Marked PaxD as user-installed")
-            
-        # 5. Install dependencies of com.mralfiem591.paxd
-        print("Installing PaxD dependencies...")
-        # Fetch dependenices from the paxd file in the repository
-        try:
-            repo_url = paxd._read_repository_url()
-            repo_url = paxd._resolve_repository_url(repo_url)
-            package_data, source_file = paxd._fetch_package_metadata(repo_url, "com.mralfiem591.paxd")
-            paxd._verbose_print(f"Successfully fetched PaxD metadata from {source_file}")
-            install_info = package_data.get('install', {})
-            dependencies = install_info.get('depend', [])
-            paxd.install('com.mralfiem591.vulnerability', user_requested=True)
-            paxd.install('com.mralfiem591.paxd-gui', user_requested=True)
-            for dep in dependencies:
-                if dep.startswith("paxd:"):
-                    paxd_package = dep[len("paxd:"):]
-                    paxd.install(paxd_package, user_requested=False)
-                elif dep.startswith("pip:"):
-                    pip_package = dep[len("pip:"):]
-                    if pip_package == "uv":
-                        uv_exists = True if subprocess.run(['uv', 'self', 'version'], capture_output=True).returncode == 0 else False
-                        if uv_exists:
-                            paxd._verbose_print("UV is already installed, skipping UV installation")
-                        else:
-                            os.system('pip install uv')
-                        continue
-                    PIP_PACKAGES.append(pip_package)
-                # Add more dependency types as needed
-                else:
-                    print(f"Unknown dependency type for '{dep}'")
-            
-            # Now install pip dependencies
-            if PIP_PACKAGES:
-                paxd._verbose_print(f"Installing PaxD pip dependencies: {PIP_PACKAGES}")
-                pip_install_command = ['uv', 'pip', 'install', '--system', '--python', sys.executable] + PIP_PACKAGES
-                result = subprocess.run(pip_install_command, capture_output=True, text=True)
-                if result.returncode != 0:
-                    print(f"{Fore.RED}Pip installation failed: {result.stderr}")
-                else:
-                    print(f"{Fore.GREEN}Pip dependencies installed successfully.")
-        except Exception as e:
-            print(f"{Fore.RED}Failed to install PaxD dependencies: {e}")
-            
-        # 6. Register paxd:// URL protocol (requires admin rights, so optional)
-        print("Registering paxd:// URL protocol...")
-        if paxd.register_protocol():
-            print(f"{Fore.GREEN}URL protocol registered successfully!")
-        else:
-            print(f"{Fore.YELLOW}URL protocol registration skipped (requires admin rights)")
-            print(f"{Fore.YELLOW}You can register it later with: paxd register-protocol")
-            
-        # 7. Delete the .FIRSTRUN file
-        if os.path.exists(os.path.join(os.path.dirname(__file__), ".FIRSTRUN")):
-            os.remove(os.path.join(os.path.dirname(__file__), ".FIRSTRUN"))
-        print(f"{Fore.GREEN}PaxD first time run initialization complete.")
-        print(f"\n{Fore.CYAN}Welcome to PaxD!{Style.RESET_ALL}\nIt is recommended you try out PaxD with our {Fore.YELLOW}paxd-test{Style.RESET_ALL} package - install it with {Fore.GREEN}`paxd install paxd-test`{Style.RESET_ALL}, and run paxd-test to see it in action!\n\nYou can uninstall it later with {Fore.RED}`paxd uninstall paxd-test`{Style.RESET_ALL}.\n\nRecommended next step: register paxd:// urls with {Fore.GREEN}`paxd register-protocol`{Style.RESET_ALL} (requires admin rights)\n")
+        _perform_first_time_init(paxd)
         exit(0)
         
     # Check version file and user-installed file in case they were removed by the user
     # Define PaxD package path
-    local_app_data = os.path.join(os.path.expandvars(r"%LOCALAPPDATA%"), "PaxD")
-    paxd_package_path = os.path.join(local_app_data, "com.mralfiem591.paxd")
+    paxd_package_path = PAXD_PACKAGE_DIR
     os.makedirs(paxd_package_path, exist_ok=True)
     
     # Create version file for PaxD if it doesn't exist
     version_file = os.path.join(paxd_package_path, ".VERSION")
-    if not os.path.exists(version_file):
-        with open(version_file, 'w') as f:
+    try:
+        with open(version_file, 'x') as f:
             f.write(paxd.paxd_version)
         print(f"Created version file for PaxD: {paxd.paxd_version}")
+    except FileExistsError:
+        pass
     
     # Mark PaxD as user-installed if not already marked
     user_installed_file = os.path.join(paxd_package_path, ".USER_INSTALLED")
-    if not os.path.exists(user_installed_file):
-        with open(user_installed_file, 'w') as f:
-            f.write(f"PaxD installed by user on {__import__('datetime').datetime.now().isoformat()}")
+    try:
+        with open(user_installed_file, 'x') as f:
+            f.write(f"PaxD installed by user on {datetime.datetime.now().isoformat()}")
         print("Marked PaxD as user-installed")
+    except FileExistsError:
+        pass
     
     # Set verbose mode if requested
     if args.verbose:
@@ -3608,245 +4281,13 @@ def main():
         paxd.trigger_system.execute_trigger("app_start", command=args.command, verbose=args.verbose)
         
         paxd._verbose_print(f"Executing command: {args.command}")
-        if args.command == "install":
-            paxd._verbose_print(f"Installing package: {args.package_name}, skip_checksum={args.skip_checksum}")
-            paxd.install(args.package_name, user_requested=True, skip_checksum=args.skip_checksum)
-        elif args.command == "uninstall":
-            paxd._verbose_print(f"Uninstalling package: {args.package_name}")
-            # Check if it's an extension before trying package uninstall
-            if paxd._check_if_extension(args.package_name):
-                print(f"'{args.package_name}' appears to be an extension, not a package.")
-                print(f"To uninstall extensions, use: paxd extension uninstall {args.package_name}")
-            else:
-                paxd.uninstall(args.package_name)
-        elif args.command == "update":
-            force_flag = args.force if hasattr(args, 'force') else False
-            paxd._verbose_print(f"Updating package: {args.package_name}, force={force_flag}, skip_checksum={args.skip_checksum}")
-            # Check if it's an extension before trying package update
-            if paxd._check_if_extension(args.package_name):
-                print(f"'{args.package_name}' appears to be an extension, not a package.")
-                print(f"To update extensions, use: paxd extension update {args.package_name}")
-            else:
-                paxd.update(args.package_name, force=force_flag, skip_checksum=args.skip_checksum)
-        elif args.command == "update-all":
-            paxd._verbose_print("Updating all packages")
-            paxd.update_all()
-        elif args.command == "info":
-            paxd._verbose_print(f"Getting info for package: {args.package_name}")
-            paxd.info(args.package_name, args.fullsize)
-        elif args.command == "search":
-            paxd._verbose_print(f"Searching for: {args.search_term}")
-            # Note: search_term is used instead of package_name for search
-            paxd.search(args.search_term)
-        elif args.command == "repo-info":
-            paxd._verbose_print("Getting repository info")
-            paxd.show_repo_info()
-        elif args.command == "reinstall":
-            if args.package_name == "deltarunedeltarune":
-                # sneaky sneaky easter egg
-                import random
-                rand = random.randint(1, 5)
-                if rand == 1:
-                    print("Kris Get The Banana\n\nPotassium")
-                elif rand == 2:
-                    print("NOWS YOUR CHANCE TO BE A [[Big Shot]]")
-                elif rand == 3:
-                    print("WHAT GIVES PEOPLE FEELINGS OF POWER:\n\nMONEY: ██\nSTATUS: ███\nBEATING JEVIL FIRST TRY: ████████████████████")
-                elif rand == 4:
-                    print(f"{Fore.MAGENTA}██     {Fore.YELLOW}██{Style.RESET_ALL}\n\nTHE POWER OF PATTERN RECOGNITION")
-                elif rand == 5:
-                    print("* You said you were a GAMER!!!\n\n* I Only Play Mobile Games\n\n* NOOOOOOOOOOOO!!!")
-                exit(0)
-            paxd._verbose_print(f"Reinstalling package: {args.package_name}")
-            if args.package_name == "com.mralfiem591.paxd":
-                print(f"{Fore.RED}Cannot reinstall PaxD itself using PaxD. Please uninstall manually.")
-                print(f"{Fore.YELLOW}Reinstalling PaxD itself requires manual uninstallation and reinstallation.")
-                print(f"{Fore.YELLOW}Please uninstall PaxD manually, then download and install the latest version from the PaxD repository.")
-                return
-            paxd.uninstall(args.package_name)
-            paxd.install(args.package_name, user_requested=True)
-        elif args.command == "credit":
-            paxd._verbose_print("Showing credits")
-            paxd.credit()
-        elif args.command == "packagedir":
-            paxd._verbose_print("Opening package directory")
-            packages = os.path.join(os.path.expandvars(r"%LOCALAPPDATA%"), "PaxD")
-            os.system(f"explorer {packages}")
-        elif args.command == "repo":
-            paxd._verbose_print("Opening repository in browser")
-            os.system(f"start {paxd._resolve_repository_url(paxd._read_repository_url())}")
-        elif args.command == "listall":
-            paxd._verbose_print("Listing all installed packages")
-            paxd.list_installed()
-        elif args.command == "export":
-            paxd._verbose_print("Exporting installed packages")
-            paxd.export()
-        elif args.command == "import":
-            paxd._verbose_print("Importing packages from export.paxd")
-            paxd.import_paxd()
-        elif args.command == "init":
-            if not args.y:
-                if input(Fore.RED + Style.BRIGHT + "Are you SURE you want to complete first time initialization? This should only ever be done ONCE! Type 'YES' in full capitals to continue.") != "YES":
-                    print(f"{Fore.YELLOW}Initialization cancelled by user.")
-                    return
-            paxd._verbose_print("Performing first time initialization via init command")
-            # 1. Create bin directory
-            if not os.path.exists(os.path.join(os.path.dirname(__file__), "bin")):
-                os.makedirs(os.path.join(os.path.dirname(__file__), "bin"))
-                
-            # 2. Add bin directory to PATH permanently
-            # Note that paxd is Windows only, so no need to check OS
-            bin_path = os.path.join(os.path.dirname(__file__), "bin")
-            if not os.path.exists(os.path.join(os.path.dirname(__file__), ".BINSKIP")) and os.path.exists(bin_path):
-                # Check if we have administrator permission, if not, prompt the user to run as admin and exit
-                if not is_admin():
-                    print("Please run this script as an administrator, for first time init only.")
-                    exit(1)
-                # Add the bin folder to path
-                if not add_to_path(bin_path):
-                    print(f"Failed to add bin folder to PATH. Try manually adding '{bin_path}' to your PATH, and make a .BINSKIP file alongside paxd.")
-                    exit(1)
-                    
-            # 3. Create a paxd.bat in the bin path
-            paxd_bin_path = os.path.join(bin_path, "paxd.bat")
-            if not os.path.exists(paxd_bin_path):
-                with open(paxd_bin_path, 'w') as f:
-                    f.write(f"@echo off\n")
-                    f.write(f'"{sys.executable}" "{os.path.abspath(__file__)}" %*\n')
-                print(f"Created paxd.bat at {paxd_bin_path}")
-            
-            # 4. Register PaxD itself as user-installed and version PaxD
-            print("Registering PaxD itself...")
-            local_app_data = os.path.join(os.path.expandvars(r"%LOCALAPPDATA%"), "PaxD")
-            paxd_package_path = os.path.join(local_app_data, "com.mralfiem591.paxd")
-            
-            # Create PaxD's package directory if it doesn't exist
-            os.makedirs(paxd_package_path, exist_ok=True)
-            
-            # Create version file for PaxD if it doesn't exist
-            version_file = os.path.join(paxd_package_path, ".VERSION")
-            if not os.path.exists(version_file):
-                with open(version_file, 'w') as f:
-                    f.write(paxd.paxd_version)
-                print(f"Created version file for PaxD: {paxd.paxd_version}")
-            
-            # Mark PaxD as user-installed if not already marked
-            user_installed_file = os.path.join(paxd_package_path, ".USER_INSTALLED")
-            if not os.path.exists(user_installed_file):
-                with open(user_installed_file, 'w') as f:
-                    f.write(f"PaxD installed by user on {__import__('datetime').datetime.now().isoformat()}")
-                print(f"{Fore.GREEN}Marked PaxD as user-installed")
-                
-            # 5. Install dependencies of com.mralfiem591.paxd
-            print("Installing PaxD dependencies...")
-            # Fetch dependenices from the paxd file in the repository
-            try:
-                repo_url = paxd._read_repository_url()
-                repo_url = paxd._resolve_repository_url(repo_url)
-                package_data, source_file = paxd._fetch_package_metadata(repo_url, "com.mralfiem591.paxd")
-                paxd._verbose_print(f"Successfully fetched PaxD metadata from {source_file}")
-                install_info = package_data.get('install', {})
-                dependencies = install_info.get('depend', [])
-                paxd.install('com.mralfiem591.vulnerability', user_requested=True)
-                paxd.install('com.mralfiem591.paxd-gui', user_requested=True)
-                for dep in dependencies:
-                    if dep.startswith("paxd:"):
-                        paxd_package = dep[len("paxd:"):]
-                        paxd.install(paxd_package, user_requested=False)
-                    elif dep.startswith("pip:"):
-                        pip_package = dep[len("pip:"):]
-                        if pip_package == "uv":
-                            uv_exists = True if subprocess.run(['uv', 'self', 'version'], capture_output=True).returncode == 0 else False
-                            if uv_exists:
-                                paxd._verbose_print("UV is already installed, skipping UV installation")
-                                continue
-                            else:
-                                os.system('pip install uv')
-                        PIP_PACKAGES.append(pip_package)
-                    # Add more dependency types as needed
-                    else:
-                        print(f"Unknown dependency type for '{dep}'")
-                
-                # Now install pip dependencies
-                if PIP_PACKAGES:
-                    paxd._verbose_print(f"Installing PaxD pip dependencies: {PIP_PACKAGES}")
-                    pip_install_command = ['uv', 'pip', 'install', '--system', '--python', sys.executable] + PIP_PACKAGES
-                    result = subprocess.run(pip_install_command, capture_output=True, text=True)
-                    if result.returncode != 0:
-                        print(f"{Fore.RED}Pip installation failed: {result.stderr}")
-                    else:
-                        print(f"{Fore.GREEN}Pip dependencies installed successfully.")
-            except Exception as e:
-                print(f"{Fore.RED}Failed to install PaxD dependencies: {e}")
-                
-            # 6. Register paxd:// URL protocol (requires admin rights, so optional)
-            print("Registering paxd:// URL protocol...")
-            if paxd.register_protocol():
-                print(f"{Fore.GREEN}URL protocol registered successfully!")
-            else:
-                print(f"{Fore.YELLOW}URL protocol registration skipped (requires admin rights)")
-                print(f"{Fore.YELLOW}You can register it later with: paxd register-protocol")
-                
-            # 7. Delete the .FIRSTRUN file
-            firstrun_file = os.path.join(os.path.dirname(__file__), ".FIRSTRUN")
-            if os.path.exists(firstrun_file):
-                os.remove(firstrun_file)
-            print(f"{Fore.GREEN}PaxD first time run initialization complete.")
-            print(f"\n{Fore.CYAN}Welcome to PaxD!{Style.RESET_ALL}\nIt is recommended you try out PaxD with our {Fore.YELLOW}paxd-test{Style.RESET_ALL} package - install it with {Fore.GREEN}`paxd install paxd-test`{Style.RESET_ALL}, and run paxd-test to see it in action!\n\nYou can uninstall it later with {Fore.RED}`paxd uninstall paxd-test`{Style.RESET_ALL}.\n\nRecommended next step: register paxd:// urls with {Fore.GREEN}`paxd register-protocol`{Style.RESET_ALL} (requires admin rights)\n")
-            
-        elif args.command == "gui":
-            paxd._verbose_print("Launching PaxD GUI")
-            try:
-                subprocess.run(['paxd-gui', 'ran-via-paxd'], check=True, shell=True)
-            # Catch specific exception for if the command paxd-gui isnt found
-            except subprocess.CalledProcessError:
-                paxd.install("com.mralfiem591.paxd-gui", user_requested=True)
-                subprocess.run(['paxd-gui', 'ran-via-paxd'], check=True, shell=True)
-            finally:
-                # Handle uninstall requests from the GUI
-                paxd._verbose_print("Checking for uninstall requests from GUI")
-                messages = paxd_sdk.Messaging.GetMessages('com.mralfiem591.paxd')
-                for message in messages:
-                    if message['from'] == 'com.mralfiem591.paxd-gui' and message['message']['queue_gui_uninstall'] == True:
-                        print(f"Received uninstall request from GUI (sent time: {message['timestamp']}), uninstalling PaxD GUI!")
-                        paxd.uninstall("com.mralfiem591.paxd-gui")
-                        paxd_sdk.Messaging.ClearMessages('com.mralfiem591.paxd')
-        
-        elif args.command == "url":
-            paxd._verbose_print(f"Processing URL: {args.url}")
-            paxd.handle_url(args.url)
-        elif args.command == "register-protocol":
-            if args.unregister:
-                paxd._verbose_print("Unregistering paxd:// protocol")
-                paxd.unregister_protocol()
-            else:
-                paxd._verbose_print("Registering paxd:// protocol")
-                paxd.register_protocol()
-        elif args.command == "check-protocol":
-            paxd._verbose_print("Checking paxd:// protocol registration")
-            paxd.check_protocol_status()
-        elif args.command == "extension":
-            if args.extension_command == "install":
-                paxd._verbose_print(f"Installing extension: {args.zip_path}")
-                ext_manager.install_extension(args.zip_path)
-            elif args.extension_command == "uninstall":
-                paxd._verbose_print(f"Uninstalling extension: {args.extension_name}")
-                ext_manager.uninstall_extension(args.extension_name)
-            elif args.extension_command == "update":
-                zip_path = getattr(args, 'zip_path', None)
-                paxd._verbose_print(f"Updating extension: {args.extension_name}, zip_path={zip_path}")
-                ext_manager.update_extension(args.extension_name, zip_path)
-            elif args.extension_command == "list":
-                paxd._verbose_print("Listing installed extensions")
-                ext_manager.list_extensions()
-            else:
-                paxd._verbose_print(f"Unknown extension command: {args.extension_command}")
-                print(f"{Fore.RED}Unknown extension command: {args.extension_command}")
-
-        else:
+        handler = getattr(args, 'func', None)
+        if handler is None:
             paxd._verbose_print(f"Unknown command: {args.command}")
             print(f"{Fore.RED}Unknown command: {args.command}")
             parser.print_help()
+        elif handler(paxd, args) is False:
+            return
             
     except KeyboardInterrupt:
         paxd._verbose_print("Operation cancelled by user (KeyboardInterrupt)")
@@ -3855,9 +4296,11 @@ def main():
     # Remove "except Exception": sentry now handles it
 
     # Fetch latest version of PaxD from the repository and notify if it has an update
-    paxd._verbose_print("Checking for PaxD updates")
-    latest_version = paxd.get_latest_version()
-    if latest_version and latest_version != paxd.paxd_version and args.command not in ["update", "update-all"]:
+    if args.command not in ["update", "update-all"]:
+        latest_version = _latest_paxd_version(paxd)
+    else:
+        latest_version = None
+    if latest_version and latest_version != paxd.paxd_version:
         print(f"{Fore.YELLOW}New PaxD version available: {Fore.RED}{paxd.paxd_version}{Fore.YELLOW} -> {Fore.GREEN}{latest_version}\n{Fore.YELLOW}Get it with '{Fore.LIGHTYELLOW_EX}paxd update paxd{Fore.YELLOW}'.")
 
     # Extension trigger for application exit